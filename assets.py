@@ -0,0 +1,97 @@
+import base64
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Files Streamlit serves at app/static/ when server.enableStaticServing is on
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+STATIC_URL = "app/static"
+
+# Global stylesheet shared by the live app and the static export
+STYLESHEET_PATH = os.path.join(STATIC_DIR, "style.css")
+
+# What Streamlit's static handler serves with a real Content-Type; anything
+# else (CSS, SVG, ...) goes out as text/plain with nosniff, which browsers refuse
+STATIC_SERVED_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif")
+
+_lock = threading.Lock()
+_stylesheet = {"mtime": None, "css": None}
+_minified = {"mtime": None, "css": None}
+# file name -> (mtime, content hash, data URI or None)
+_assets = {}
+
+
+def stylesheet():
+    """
+    Return the global stylesheet, re-reading it only when it changes on disk
+    """
+    mtime = os.stat(STYLESHEET_PATH).st_mtime_ns
+    with _lock:
+        if _stylesheet["mtime"] != mtime:
+            with open(STYLESHEET_PATH) as f:
+                _stylesheet["css"] = f.read()
+            _stylesheet["mtime"] = mtime
+        return _stylesheet["css"]
+
+
+def minify_css(css):
+    """
+    Strip comments and insignificant whitespace from a stylesheet
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    # Spaces before ":" can be significant in selectors ("a :hover"), so only strip after it
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def minified_stylesheet():
+    """
+    The global stylesheet minified, rebuilt only when the source changes
+    """
+    source = stylesheet()
+    mtime = _stylesheet["mtime"]
+    with _lock:
+        if _minified["mtime"] != mtime:
+            _minified.update(mtime=mtime, css=minify_css(source))
+        return _minified["css"]
+
+
+def stylesheet_tag():
+    """
+    HTML that applies the global stylesheet, inlined: Streamlit's static
+    file serving would send a .css file as text/plain
+    """
+    return f"<style>{minified_stylesheet()}</style>"
+
+
+def _asset(name):
+    path = os.path.join(STATIC_DIR, name)
+    mtime = os.stat(path).st_mtime_ns
+    with _lock:
+        cached = _assets.get(name)
+        if cached is None or cached[0] != mtime:
+            with open(path, "rb") as f:
+                data = f.read()
+            data_uri = None
+            if not name.lower().endswith(STATIC_SERVED_EXTENSIONS):
+                mime_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+                data_uri = f"data:{mime_type};base64," + base64.b64encode(data).decode()
+            cached = _assets[name] = (mtime, hashlib.sha256(data).hexdigest()[:12], data_uri)
+        return cached
+
+
+def asset_url(name):
+    """
+    URL of a file in static/: images Streamlit serves get a content-hash
+    version for caching, anything else (e.g. SVG) is inlined as a data URI
+    """
+    if name.startswith(("http://", "https://", "data:")):
+        return name
+    _, digest, data_uri = _asset(name)
+    return data_uri or f"{STATIC_URL}/{name}?v={digest}"
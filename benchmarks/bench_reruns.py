@@ -0,0 +1,167 @@
+"""
+Headless rerun benchmark for app.py.
+
+Each page (Home, Projects, GitHub, Contact) is driven through Streamlit's
+AppTest harness, with GitHub replayed from recorded fixtures by a local stub and
+the contact form delivering to a local SMTP sink. For every page it reports
+p50/p95 rerun latency and the memory allocated during a rerun (tracemalloc
+peak), and can compare against a saved baseline:
+
+    python -m benchmarks.bench_reruns --save-baseline .benchmarks/reruns.json
+    python -m benchmarks.bench_reruns --baseline .benchmarks/reruns.json --threshold 0.25
+
+The comparison exits with status 1 when any page regresses beyond the threshold.
+"""
+import argparse
+import itertools
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.stubs import GitHubStub, SMTPSink, stub_environment
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+PAGES = ["Home", "Projects", "GitHub", "Contact"]
+METRICS = ["p50_ms", "p95_ms", "alloc_kb"]
+
+_messages = itertools.count(1)
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile
+    """
+    ordered = sorted(values)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def new_app_test():
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.secrets["api_keys"] = {"TOKEN": ""}
+    return at
+
+
+def prepare(at, page):
+    """
+    Set up the widgets for the next rerun of a page
+    """
+    if page == "Contact":
+        at.text_input[0].input("visitor@example.com")
+        at.text_input[1].input("Benchmark")
+        # A fresh message each time so duplicate suppression doesn't reject it
+        at.text_area[0].input(f"Hello from the rerun benchmark ({next(_messages)}).")
+        at.button[0].click()
+
+
+def check(at, page, submitted=True):
+    if at.exception:
+        raise RuntimeError(f"{page} raised: {at.exception[0].value}")
+    if submitted and page == "Contact" and not at.success:
+        raise RuntimeError("Contact form submission was not accepted")
+    if page == "GitHub" and not at.success:
+        raise RuntimeError("GitHub page did not list the fixture repositories")
+
+
+def bench_page(at, page, reruns, alloc_reruns):
+    # Navigating runs the page transition once; it is not part of the steady rerun cost
+    at.sidebar.radio[0].set_value(page).run()
+    check(at, page, submitted=False)
+
+    timings = []
+    for _ in range(reruns):
+        prepare(at, page)
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+        check(at, page)
+
+    # Separate pass so tracing overhead doesn't skew the latency numbers
+    allocations = []
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_reruns):
+            prepare(at, page)
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            at.run()
+            allocations.append((tracemalloc.get_traced_memory()[1] - before) / 1024)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "p50_ms": round(percentile(timings, 50), 2),
+        "p95_ms": round(percentile(timings, 95), 2),
+        "alloc_kb": round(statistics.median(allocations), 1),
+    }
+
+
+def run(reruns, alloc_reruns, latency, backend="rest"):
+    github = GitHubStub(latency=latency).start()
+    smtp = SMTPSink().start()
+    work_dir = tempfile.mkdtemp(prefix="portfolio-bench-")
+    os.environ.update(stub_environment(github, smtp, work_dir, backend))
+    try:
+        at = new_app_test()
+        at.run()
+        return {page: bench_page(at, page, reruns, alloc_reruns) for page in PAGES}
+    finally:
+        github.stop()
+        smtp.stop()
+
+
+def compare(results, baseline, threshold):
+    """
+    Return a list of (page, metric, baseline, current) that regressed
+    """
+    regressions = []
+    for page, metrics in results.items():
+        for metric in METRICS:
+            before = baseline.get(page, {}).get(metric)
+            if before and metrics[metric] > before * (1 + threshold):
+                regressions.append((page, metric, before, metrics[metric]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark reruns of app.py")
+    parser.add_argument("--reruns", type=int, default=30, help="timed reruns per page")
+    parser.add_argument("--alloc-reruns", type=int, default=5, help="traced reruns per page")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="seconds the GitHub stub waits before answering")
+    parser.add_argument("--backend", choices=["rest", "graphql"], default="rest",
+                        help="GitHub backend the app fetches repositories with")
+    parser.add_argument("--baseline", help="compare against this saved result")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed relative regression (default 0.25 = 25%%)")
+    parser.add_argument("--save-baseline", help="write the results to this file")
+    args = parser.parse_args()
+
+    results = run(args.reruns, args.alloc_reruns, args.latency, args.backend)
+
+    print(f"{'page':<10} {'p50 ms':>9} {'p95 ms':>9} {'alloc KB':>10}")
+    for page, metrics in results.items():
+        print(f"{page:<10} {metrics['p50_ms']:>9.2f} {metrics['p95_ms']:>9.2f} {metrics['alloc_kb']:>10.1f}")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.save_baseline) or ".", exist_ok=True)
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for page, metric, before, after in regressions:
+            print(f"REGRESSION {page} {metric}: {before} -> {after}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Import-time report for the app's startup path and each lazily loaded page.
+
+Runs fresh interpreters with `python -X importtime` and reports how long the
+imports done by app.py itself take, and how much each page module adds the
+first time a visitor opens it:
+
+    python -m benchmarks.import_report
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# What app.py imports before any page module is loaded
+STARTUP = "import streamlit, profiling, content, views"
+
+PAGE_MODULES = {
+    "Home": "views.home",
+    "Projects": "views.projects",
+    "GitHub": "views.github",
+    "Contact": "views.contact",
+}
+
+# Heavy dependencies worth calling out when they load
+WATCHED = ["pandas", "numpy", "smtplib", "email.message", "requests", "pyarrow"]
+
+
+def import_times(code):
+    """
+    Run code under -X importtime; returns {module: (self_us, cumulative_us, depth)}
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        times[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return times
+
+
+def total_ms(times, modules):
+    return sum(times[module][0] for module in modules) / 1000
+
+
+def main():
+    startup = import_times(STARTUP)
+    print(f"startup imports (app.py): {total_ms(startup, startup):8.1f} ms, {len(startup)} modules")
+    loaded = [module for module in WATCHED if module in startup]
+    print(f"  heavy modules loaded at startup: {', '.join(loaded) or 'none'}")
+    print()
+
+    print(f"{'page':<10} {'first visit adds':>17} {'modules':>8}  heaviest new imports")
+    for page, module in PAGE_MODULES.items():
+        times = import_times(f"{STARTUP}; import {module}")
+        new = [name for name in times if name not in startup]
+        # The page module's own direct imports, by cumulative time
+        children = [name for name in new if name != module]
+        depth = min((times[name][2] for name in children), default=0)
+        heaviest = sorted(
+            (name for name in children if times[name][2] == depth),
+            key=lambda name: times[name][1], reverse=True,
+        )[:3]
+        summary = ", ".join(f"{name} {times[name][1] / 1000:.0f} ms" for name in heaviest)
+        print(f"{page:<10} {total_ms(times, new):14.1f} ms {len(new):>8}  {summary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+Concurrent-session load test for app.py.
+
+Starts the app on a local Streamlit server (GitHub and SMTP replaced by the
+local stubs), opens N simulated browser sessions over Streamlit's websocket
+protocol and has each one walk the navigation radio through every page. It
+reports rerun throughput, latency percentiles and the server's resident memory
+per open session:
+
+    python -m benchmarks.load_test --sessions 50 --rounds 3
+
+Use --url and --pid to target a server that is already running instead.
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.websocket import websocket_connect
+
+from benchmarks.bench_reruns import APP_PATH, percentile
+from benchmarks.stubs import GitHubStub, SMTPSink, stub_environment
+
+# Title each page renders, used to confirm the navigation actually happened
+PAGE_TITLES = {
+    "Home": "Data Science Portfolio",
+    "Projects": "Data Science Projects",
+    "GitHub": "GitHub Repositories",
+    "Contact": "Contact Me",
+}
+
+
+def rss_kb(pid):
+    """
+    Resident set size of a process in KB (Linux only, None elsewhere)
+    """
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port, env):
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP_PATH,
+         "--server.port", str(port), "--server.headless", "true",
+         "--browser.gatherUsageStats", "false"],
+        env=env, cwd=env["LOAD_TEST_WORK_DIR"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("Streamlit server did not become healthy")
+
+
+class Session:
+    """
+    One simulated visitor speaking Streamlit's websocket protocol
+    """
+
+    # Widget value type of st.radio; newer Streamlit sends the label, older the index
+    radio_value = "string_value"
+
+    def __init__(self, url, timeout):
+        self.url = url.rstrip("/").replace("http", "ws", 1) + "/_stcore/stream"
+        self.timeout = timeout
+        self.connection = None
+        self.radio_id = None
+        self.options = []
+
+    async def open(self):
+        self.connection = await websocket_connect(self.url, subprotocols=["streamlit"],
+                                                  max_message_size=64 * 1024 * 1024)
+        return await self.rerun(None)
+
+    async def rerun(self, page):
+        """
+        Run the script with the radio set to page; returns (seconds, title seen)
+        """
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        if page is not None:
+            widget = msg.rerun_script.widget_states.widgets.add(id=self.radio_id)
+            if self.radio_value == "string_value":
+                widget.string_value = page
+            else:
+                widget.int_value = self.options.index(page)
+
+        start = time.perf_counter()
+        await self.connection.write_message(msg.SerializeToString(), binary=True)
+        title = None
+        while True:
+            data = await asyncio.wait_for(self.connection.read_message(), self.timeout)
+            if data is None:
+                raise ConnectionError("server closed the session")
+            forward = ForwardMsg()
+            forward.ParseFromString(data)
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "radio" and self.radio_id is None:
+                    self.radio_id = element.radio.id
+                    self.options = list(element.radio.options)
+                elif element_type == "heading" and title is None:
+                    title = element.heading.body
+            elif kind == "script_finished":
+                return time.perf_counter() - start, title
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+
+
+async def navigate(session, page):
+    elapsed, title = await session.rerun(page)
+    if title != PAGE_TITLES[page] and Session.radio_value == "string_value":
+        # Older Streamlit versions identify the radio choice by index
+        Session.radio_value = "int_value"
+        elapsed, title = await session.rerun(page)
+    if title != PAGE_TITLES[page]:
+        raise RuntimeError(f"navigating to {page} rendered {title!r}")
+    return elapsed
+
+
+async def walk(session, rounds, latencies):
+    pages = list(PAGE_TITLES)
+    for _ in range(rounds):
+        # Start from Projects so every step is a page change
+        for page in pages[1:] + pages[:1]:
+            latencies.append(await navigate(session, page))
+
+
+async def run(url, sessions, rounds, timeout, pid):
+    # Warm the process (imports, caches, background refresher) with one visitor
+    warmup = Session(url, timeout)
+    await warmup.open()
+    await walk(warmup, 1, [])
+    warmup.close()
+    await asyncio.sleep(1)
+    rss_before = rss_kb(pid) if pid else None
+
+    clients = [Session(url, timeout) for _ in range(sessions)]
+    await asyncio.gather(*(client.open() for client in clients))
+
+    latencies = []
+    start = time.perf_counter()
+    results = await asyncio.gather(*(walk(client, rounds, latencies) for client in clients),
+                                   return_exceptions=True)
+    duration = time.perf_counter() - start
+
+    # Sessions are still open here, so their state counts towards RSS
+    rss_after = rss_kb(pid) if pid else None
+    for client in clients:
+        client.close()
+
+    errors = [result for result in results if isinstance(result, Exception)]
+    return latencies, duration, errors, rss_before, rss_after
+
+
+def report(sessions, latencies, duration, errors, rss_before, rss_after):
+    print(f"sessions:       {sessions}")
+    print(f"reruns:         {len(latencies)} in {duration:.1f}s "
+          f"({len(latencies) / duration:.1f} reruns/s)")
+    if latencies:
+        ms = [latency * 1000 for latency in latencies]
+        print(f"latency ms:     p50 {percentile(ms, 50):.0f}  p95 {percentile(ms, 95):.0f}  "
+              f"p99 {percentile(ms, 99):.0f}  max {max(ms):.0f}")
+    if rss_before is not None and rss_after is not None:
+        print(f"server RSS:     {rss_before / 1024:.1f} MB before, {rss_after / 1024:.1f} MB with "
+              f"all sessions open ({(rss_after - rss_before) / sessions:.0f} KB per session)")
+    if errors:
+        print(f"failed sessions: {len(errors)} (first: {errors[0]!r})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for app.py")
+    parser.add_argument("--sessions", type=int, default=20, help="simultaneous sessions")
+    parser.add_argument("--rounds", type=int, default=2,
+                        help="times each session walks through all pages")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds to wait per rerun")
+    parser.add_argument("--url", help="target a running server instead of starting one")
+    parser.add_argument("--pid", type=int, help="server process id to sample memory from with --url")
+    args = parser.parse_args()
+
+    github = smtp = server = None
+    url, pid = args.url, args.pid
+    try:
+        if url is None:
+            github = GitHubStub().start()
+            smtp = SMTPSink().start()
+            work_dir = tempfile.mkdtemp(prefix="portfolio-load-")
+            env = dict(os.environ, **stub_environment(github, smtp, work_dir),
+                       LOAD_TEST_WORK_DIR=work_dir)
+            port = free_port()
+            server = start_server(port, env)
+            url, pid = f"http://127.0.0.1:{port}", server.pid
+
+        results = asyncio.run(run(url, args.sessions, args.rounds, args.timeout, pid))
+        report(args.sessions, *results)
+        if results[2]:
+            sys.exit(1)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        if github is not None:
+            github.stop()
+            smtp.stop()
+
+
+if __name__ == "__main__":
+    main()
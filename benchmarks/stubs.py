@@ -0,0 +1,292 @@
+"""
+Local stand-ins for GitHub and the SMTP server used by the benchmarks.
+
+GitHubStub replays recorded API responses from fixtures/github.json, a map of
+API path -> JSON payload (or "<path>.html" -> rendered HTML). List payloads are
+paginated like the real API, with Link, ETag and rate limit headers. The
+GraphQL repos query is answered from the same recorded REST listings. SMTPSink accepts and counts every message.
+
+Re-record the GitHub fixture from the live API with:
+
+    python -m benchmarks.stubs --record jadontelep
+"""
+import argparse
+import hashlib
+import json
+import os
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+GITHUB_FIXTURE = os.path.join(FIXTURES_DIR, "github.json")
+
+
+class GitHubStub:
+    """
+    Threaded HTTP server answering GitHub REST calls from recorded fixtures
+    """
+
+    def __init__(self, fixture_path=GITHUB_FIXTURE, latency=0.0):
+        with open(fixture_path) as f:
+            self.fixtures = json.load(f)
+        self.latency = latency
+        self.requests = 0
+        # Remaining calls reported per X-RateLimit-Resource
+        self.rate_limit = {"core": 4999, "graphql": 4999}
+        # Statuses to answer the next requests with instead of the fixtures
+        self.failures = []
+        # (method, path, request headers) of every request
+        self.log = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if not self.fail():
+                    self.reply(*stub.respond(self.path, self.headers))
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if not self.fail():
+                    self.reply(*stub.respond_graphql(self.path, self.headers, body))
+
+            def fail(self):
+                stub.requests += 1
+                stub.log.append((self.command, self.path, dict(self.headers)))
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if not stub.failures:
+                    return False
+                self.reply(stub.failures.pop(0), {}, b'{"message": "Server Error"}')
+                return True
+
+            def reply(self, status, headers, body):
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def response_headers(self, resource):
+        return {
+            "Content-Type": "application/json; charset=utf-8",
+            "X-RateLimit-Resource": resource,
+            "X-RateLimit-Remaining": str(self.rate_limit[resource]),
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+        }
+
+    def respond(self, path, request_headers):
+        url = urlparse(path)
+        key = url.path.strip("/").lower()
+        headers = self.response_headers("core")
+        # Rendered HTML representations are recorded under "<path>.html"
+        if "html" in request_headers.get("Accept", ""):
+            key += ".html"
+            headers["Content-Type"] = "text/html; charset=utf-8"
+        payload = self.fixtures.get(key)
+        if payload is None:
+            return 404, headers, b'{"message": "Not Found"}'
+        if isinstance(payload, str):
+            return 200, headers, payload.encode()
+
+        if isinstance(payload, list):
+            query = parse_qs(url.query)
+            per_page = int(query.get("per_page", ["30"])[0])
+            page = int(query.get("page", ["1"])[0])
+            # Repos are recorded in GitHub's default order; the other sorts are newest first
+            if query.get("sort", [""])[0] in ("updated", "pushed", "created"):
+                field = query["sort"][0] + "_at"
+                payload = sorted(payload, key=lambda item: item[field],
+                                 reverse=query.get("direction", ["desc"])[0] == "desc")
+            last = max(1, -(-len(payload) // per_page))
+            if last > 1:
+                headers["Link"] = f'<{self.url}{url.path}?per_page={per_page}&page={last}>; rel="last"'
+            payload = payload[(page - 1) * per_page:page * per_page]
+
+        body = json.dumps(payload).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        headers["ETag"] = etag
+        if request_headers.get("If-None-Match") == etag:
+            return 304, headers, b""
+        return 200, headers, body
+
+    def respond_graphql(self, path, request_headers, body):
+        """
+        Answer the repos query of github_graphql; variables are all it looks at
+        """
+        headers = self.response_headers("graphql")
+        if urlparse(path).path.strip("/") != "graphql":
+            return 404, headers, b'{"message": "Not Found"}'
+        if not request_headers.get("Authorization"):
+            return 401, headers, b'{"message": "This endpoint requires you to be authenticated."}'
+
+        variables = json.loads(body).get("variables", {})
+        repos = self.fixtures.get(f"users/{variables['login'].lower()}/repos")
+        if repos is None:
+            data = {"repositoryOwner": None}
+        else:
+            field = {"UPDATED_AT": "updated_at", "PUSHED_AT": "pushed_at",
+                     "CREATED_AT": "created_at"}.get(variables.get("orderBy"), "stargazers_count")
+            repos = sorted(repos, key=lambda repo: repo[field], reverse=True)
+            start = int(variables.get("after") or 0)
+            end = start + variables["first"]
+            data = {"repositoryOwner": {"repositories": {
+                "pageInfo": {"hasNextPage": end < len(repos), "endCursor": str(end)},
+                "nodes": [_graphql_node(repo) for repo in repos[start:end]],
+            }}}
+        return 200, headers, json.dumps({"data": data}).encode()
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, name="github-stub", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _graphql_node(repo):
+    """
+    A recorded REST repo as a node of the GraphQL repos query
+    """
+    language = repo.get("language")
+    return {
+        "databaseId": repo["id"],
+        "name": repo["name"],
+        "description": repo.get("description"),
+        "url": repo["html_url"],
+        "createdAt": repo["created_at"],
+        "updatedAt": repo["updated_at"],
+        "stargazerCount": repo["stargazers_count"],
+        "forkCount": repo["forks_count"],
+        "issues": {"totalCount": repo["open_issues_count"]},
+        "pullRequests": {"totalCount": 0},
+        "primaryLanguage": {"name": language} if language else None,
+        "languages": {"edges": [{"size": repo["size"] * 1024, "node": {"name": language}}]
+                      if language else []},
+        "repositoryTopics": {"nodes": [{"topic": {"name": topic}} for topic in repo.get("topics", [])]},
+        "defaultBranchRef": {"target": {"committedDate": repo["pushed_at"]}},
+    }
+
+
+class SMTPSink:
+    """
+    Minimal SMTP server that accepts every message and keeps a count
+    """
+
+    def __init__(self):
+        self.messages = 0
+        self.connections = 0
+        sink = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line):
+                self.wfile.write(line.encode() + b"\r\n")
+
+            def handle(self):
+                sink.connections += 1
+                self.reply("220 sink ESMTP")
+                in_data = False
+                for raw in self.rfile:
+                    line = raw.rstrip(b"\r\n")
+                    if in_data:
+                        if line == b".":
+                            in_data = False
+                            sink.messages += 1
+                            self.reply("250 OK")
+                        continue
+                    command = line[:4].upper()
+                    if command in (b"EHLO", b"HELO"):
+                        self.reply("250 sink")
+                    elif command == b"DATA":
+                        in_data = True
+                        self.reply("354 End data with <CR><LF>.<CR><LF>")
+                    elif command == b"QUIT":
+                        self.reply("221 Bye")
+                        return
+                    else:
+                        self.reply("250 OK")
+
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.host, self.port = self.server.server_address
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, name="smtp-sink", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def stub_environment(github, smtp, work_dir, backend="rest"):
+    """
+    Environment variables pointing the app at the stubs and a scratch directory
+    """
+    return {
+        "GITHUB_API_URL": github.url,
+        "GITHUB_BACKEND": backend,
+        # The GraphQL backend is only used with a token; the stub accepts any
+        "GITHUB_TOKEN": "stub-token" if backend == "graphql" else "",
+        "SMTP_HOST": smtp.host,
+        "SMTP_PORT": str(smtp.port),
+        "SMTP_STARTTLS": "0",
+        "MAIL_SPOOL_DIR": os.path.join(work_dir, "mail_spool"),
+        "GITHUB_SNAPSHOT_DIR": os.path.join(work_dir, "cache"),
+        # Benchmarks submit the contact form on every rerun
+        "CONTACT_BURST": "1000000",
+    }
+
+
+def record(usernames, fixture_path=GITHUB_FIXTURE):
+    """
+    Record the repo listings and READMEs of the given accounts from the live GitHub API
+    """
+    import requests
+
+    fixtures = {}
+    for username in usernames:
+        repos, page = [], 1
+        while True:
+            response = requests.get(f"https://api.github.com/users/{username}/repos",
+                                    params={"per_page": 100, "page": page}, timeout=10)
+            response.raise_for_status()
+            repos.extend(response.json())
+            if "next" not in response.links:
+                break
+            page += 1
+        fixtures[f"users/{username.lower()}/repos"] = repos
+
+        for repo in repos:
+            path = f"repos/{repo['full_name'].lower()}/readme"
+            response = requests.get(f"https://api.github.com/{path}", timeout=10)
+            if response.status_code == 404:
+                continue
+            response.raise_for_status()
+            fixtures[path] = response.json()
+            response = requests.get(f"https://api.github.com/{path}", timeout=10,
+                                    headers={"Accept": "application/vnd.github.html+json"})
+            response.raise_for_status()
+            fixtures[f"{path}.html"] = response.text
+    with open(fixture_path, "w") as f:
+        json.dump(fixtures, f, indent=1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record GitHub fixtures for the benchmarks")
+    parser.add_argument("--record", nargs="+", metavar="USERNAME", required=True)
+    args = parser.parse_args()
+    record(args.record)
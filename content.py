@@ -0,0 +1,193 @@
+import hashlib
+import json
+import os
+import threading
+import tomllib
+from html import escape
+
+from assets import asset_url
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Structured portfolio content rendered in the sidebar and on the pages
+CONTENT_PATH = os.path.join(BASE_DIR, "content.toml")
+
+CARD_BG = "#f8f9fa"
+TITLE_COLOR = "#0066cc"
+SUBTITLE_COLOR = "#666666"
+
+_lock = threading.Lock()
+_loaded = {"mtime": None, "content": None, "hashes": {}}
+
+# (fragment name, sha256 of its section's data) -> rendered HTML, shared by all sessions
+_fragments = {}
+
+
+def _section_hash(section, data):
+    return hashlib.sha256(json.dumps([section, data], sort_keys=True).encode()).hexdigest()
+
+
+def load_content():
+    """
+    Return the parsed content file, re-reading it only when it changes on disk
+    """
+    mtime = os.stat(CONTENT_PATH).st_mtime_ns
+    with _lock:
+        if _loaded["mtime"] != mtime:
+            with open(CONTENT_PATH, "rb") as f:
+                content = tomllib.load(f)
+            hashes = {section: _section_hash(section, data) for section, data in content.items()}
+            # Keep fragments for sections that did not change, drop the rest
+            live = set(hashes.values())
+            for key in [key for key in _fragments if key[1] not in live]:
+                del _fragments[key]
+            _loaded.update(mtime=mtime, content=content, hashes=hashes)
+        return _loaded["content"]
+
+
+def _list(items):
+    return "".join(f"<li>{escape(item)}</li>" for item in items)
+
+
+def _heading(title):
+    return (f'<h4 style="color:{TITLE_COLOR}; margin-bottom: 15px; border-bottom: 1px solid #eee; '
+            f'padding-bottom: 10px;">{escape(title)}</h4>')
+
+
+def _render_profile(profile):
+    return f"""
+<div style="display: flex; flex-direction: column; align-items: center; justify-content: center; text-align: center;">
+    <h2 style="color:{TITLE_COLOR}; margin-top: 15px; margin-bottom: 10px;">{escape(profile['name'])}</h2>
+    <p style="color: {SUBTITLE_COLOR}; margin-bottom: 15px;">{escape(profile['tagline'])}</p>
+    <img src="{escape(asset_url(profile['image']))}" width="120" alt="{escape(profile['name'])}">
+</div>
+<div style="text-align: center; margin: 20px 0;">
+    {_heading("Navigation")}
+</div>
+"""
+
+
+def _social_link(link):
+    return f"""
+<a href="{escape(link['url'])}" target="_blank" style="text-decoration: none; flex: 1;">
+    <div style="background-color:{CARD_BG}; padding:8px; text-align:center; border-radius:5px;">
+        {escape(link['label'])}
+    </div>
+</a>
+"""
+
+
+def _render_contact_details(profile):
+    return f"""
+<div style="margin-top: 30px;">
+    {_heading("Contact")}
+    <p>📧 {escape(profile['email'])}</p>
+    <p>📱 {escape(profile['phone'])}</p>
+    <p>📍 {escape(profile['location'])}</p>
+</div>
+<div style="margin-top: 20px;">
+    {_heading("Social Links")}
+    <div style="display: flex; gap: 1rem;">{"".join(map(_social_link, profile['links']))}</div>
+</div>
+"""
+
+
+def _render_contact(contact):
+    return f"""
+<div style="background-color:{CARD_BG}; padding:20px; border-radius:10px; margin-bottom:30px; animation: fadeIn 0.5s ease-out;">
+    <p style="font-size:18px;">{escape(contact['intro'])}</p>
+</div>
+<h3 style="color:{TITLE_COLOR}; margin-bottom:20px; animation: fadeIn 0.6s ease-out;">Send Me a Message</h3>
+"""
+
+
+def _render_availability(contact):
+    return f"""
+<div style="background-color:#e8f4f8; padding:20px; border-radius:10px; margin-top:30px; animation: fadeIn 0.7s ease-out;
+     box-shadow: 0 4px 6px rgba(0,0,0,0.1); transition: transform 0.3s ease, box-shadow 0.3s ease;">
+    <h3 style="color:{TITLE_COLOR}; margin-bottom:15px;">Availability</h3>
+    <p style="font-size:16px;">{escape(contact['availability'])}</p>
+</div>
+"""
+
+
+def _render_about(about):
+    paragraphs = "".join(f"<p>{escape(text)}</p>" for text in about["paragraphs"])
+    return f"<h2>{escape(about['title'])}</h2>{paragraphs}"
+
+
+def _render_expertise(expertise):
+    return f"""
+<div style="background-color:{CARD_BG}; padding:15px; border-radius:10px; margin-top:20px;">
+<h3 style="color:{TITLE_COLOR};">{escape(expertise['title'])}</h3>
+<ul>{_list(expertise['items'])}</ul>
+</div>
+"""
+
+
+def _render_experience(jobs):
+    return "".join(f"""
+<div class="experience-card" style="background-color:{CARD_BG}; padding:20px; border-radius:10px; margin-bottom:20px; transition: transform 0.3s ease, box-shadow 0.3s ease;">
+    <h4 style="color:{TITLE_COLOR};">{escape(job['title'])}</h4>
+    <p><strong>Period:</strong> {escape(job['period'])}</p>
+    <ul>{_list(job['highlights'])}</ul>
+</div>
+""" for job in jobs)
+
+
+def _render_education(education):
+    return f"""
+<div style="display: flex; gap: 1rem;">
+    <div style="flex: 3;">
+        <h4>{escape(education['degree'])}</h4>
+        <p><strong>{escape(education['school'])}</strong> | Graduation: {escape(education['graduation'])}</p>
+    </div>
+    <div style="flex: 1;">
+        <p><strong>GPA: {escape(education['gpa'])}</strong></p>
+        <p><em>{escape(education['honors'])}</em></p>
+    </div>
+</div>
+<p><strong>Minor in {escape(education['minor'])}</strong> - {escape(education['school'])}</p>
+"""
+
+
+def _render_projects(projects):
+    return "".join(f"""
+<h2>Project {number}: {escape(project['title'])}</h2>
+<h3>Overview</h3>
+<p>{escape(project['overview'])}</p>
+<h3>Technologies Used</h3>
+<ul>{_list(project['technologies'])}</ul>
+<h3>Results</h3>
+<p>{escape(project['results'])}</p>
+""" for number, project in enumerate(projects, start=1))
+
+
+# fragment name -> (content section, renderer)
+RENDERERS = {
+    "profile": ("profile", _render_profile),
+    "contact_details": ("profile", _render_contact_details),
+    "contact": ("contact", _render_contact),
+    "availability": ("contact", _render_availability),
+    "about": ("about", _render_about),
+    "expertise": ("expertise", _render_expertise),
+    "experience": ("experience", _render_experience),
+    "education": ("education", _render_education),
+    "projects": ("projects", _render_projects),
+}
+
+
+def render(name):
+    """
+    Return a named HTML fragment of the content.
+
+    Fragments are cached by a hash of their section's data, so a fragment is
+    only re-rendered when its part of the content file actually changes.
+    """
+    content = load_content()
+    section, renderer = RENDERERS[name]
+    key = (name, _loaded["hashes"][section])
+    html = _fragments.get(key)
+    if html is None:
+        html = _fragments[key] = renderer(content[section])
+    return html
@@ -0,0 +1,175 @@
+"""
+Export the portfolio as a static HTML/CSS site.
+
+Home, Projects, GitHub and Contact are rendered from the same content fragments
+and stylesheet as the live app, with the GitHub repo table baked in from the
+current repo snapshot. Only the contact form needs the live Streamlit app:
+
+    python export_static.py --out dist --live-url https://portfolio.example.com
+"""
+import argparse
+import os
+import shutil
+from html import escape
+
+import assets
+import content
+from repo_refresher import RepoRefresher
+from repo_table import recent_repos_html
+from utils import GITHUB_ACCOUNTS
+
+SITE_TITLE = "Jadon Telep - Data Science Portfolio"
+
+# page name -> file name, in navigation order
+PAGES = {
+    "Home": "index.html",
+    "Projects": "projects.html",
+    "GitHub": "github.html",
+    "Contact": "contact.html",
+}
+
+# Page layout the live app gets from Streamlit itself
+LAYOUT_CSS = """
+body { margin: 0; display: flex; min-height: 100vh; }
+.sidebar { width: 300px; flex-shrink: 0; padding: 1.5rem; background-color: #f8f9fa; box-sizing: border-box; }
+.sidebar nav a { display: block; padding: 6px 0; color: #333333; text-decoration: none; }
+.sidebar nav a.active { color: #0066cc; font-weight: bold; }
+.main { flex: 1; max-width: 1100px; padding: 2rem 3rem; animation: fadeIn 0.5s ease-out; }
+.columns { display: flex; gap: 2rem; }
+.dataframe { border-collapse: collapse; width: 100%; }
+.dataframe th, .dataframe td { border: 1px solid #dddddd; padding: 6px 10px; text-align: left; }
+.button { display: inline-block; padding: 10px 18px; border-radius: 5px; background-color: #0066cc; color: white !important; text-decoration: none; }
+@media (max-width: 800px) { body, .columns { flex-direction: column; } .sidebar { width: auto; } }
+"""
+
+
+def _sidebar(active):
+    links = "".join(
+        f'<a href="{file_name}" class="{"active" if name == active else ""}">{name}</a>'
+        for name, file_name in PAGES.items()
+    )
+    return f"""
+<aside class="sidebar">
+    {content.render("profile")}
+    <nav>{links}</nav>
+    {content.render("contact_details")}
+</aside>
+"""
+
+
+def _page(active, body):
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{escape(SITE_TITLE)}</title>
+<link rel="stylesheet" href="style.css">
+</head>
+<body>
+{_sidebar(active)}
+<main class="main">
+{body}
+</main>
+</body>
+</html>
+"""
+
+
+def render_home():
+    return f"""
+<h1>Data Science Portfolio</h1>
+<div class="columns">
+    <div style="flex: 3;">{content.render("about")}</div>
+    <div style="flex: 2;">{content.render("expertise")}</div>
+</div>
+<h3>Professional Experience</h3>
+{content.render("experience")}
+<h3>Education</h3>
+{content.render("education")}
+"""
+
+
+def render_projects():
+    return f"""
+<h1>Data Science Projects</h1>
+{content.render("projects")}
+"""
+
+
+def render_github(usernames, repos):
+    if not repos:
+        return f"""
+<h1>GitHub Repositories</h1>
+<p>No public repositories found for {escape(", ".join(usernames))}</p>
+"""
+    return f"""
+<h1>GitHub Repositories</h1>
+<p>Found {len(repos)} public repositories</p>
+{recent_repos_html(repos, len(repos))}
+"""
+
+
+def render_contact(live_url):
+    if live_url:
+        form_link = f'<p><a class="button" href="{escape(live_url)}">Open the contact form</a></p>'
+    else:
+        email = content.load_content()["profile"]["email"]
+        form_link = f'<p><a class="button" href="mailto:{escape(email)}">Email me</a></p>'
+    return f"""
+<h1>Contact Me</h1>
+{content.render("contact")}
+{form_link}
+{content.render("availability")}
+"""
+
+
+def load_repos(usernames, refresh=True):
+    """
+    Repo list to bake into the export: fresh from GitHub, or the saved snapshots
+    """
+    refresher = RepoRefresher(usernames)
+    refresher.load_snapshot()
+    if refresh and not refresher.refresh():
+        for username, error in refresher.errors.items():
+            print(f"Could not reach GitHub for {username} ({error}), using the saved snapshot")
+    return refresher.snapshot()
+
+
+def export(out_dir, usernames, live_url=None, refresh=True):
+    repos = load_repos(usernames, refresh)
+    bodies = {
+        "Home": render_home(),
+        "Projects": render_projects(),
+        "GitHub": render_github(usernames, repos),
+        "Contact": render_contact(live_url),
+    }
+
+    os.makedirs(out_dir, exist_ok=True)
+    for name, file_name in PAGES.items():
+        with open(os.path.join(out_dir, file_name), "w") as f:
+            f.write(_page(name, bodies[name]))
+    with open(os.path.join(out_dir, "style.css"), "w") as f:
+        f.write(assets.minify_css(assets.stylesheet() + LAYOUT_CSS))
+
+    # Same relative URLs as the live app's static serving; small SVGs are already inlined
+    shutil.copytree(assets.STATIC_DIR, os.path.join(out_dir, assets.STATIC_URL), dirs_exist_ok=True,
+                    ignore=shutil.ignore_patterns("style.css"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the portfolio as a static site")
+    parser.add_argument("--out", default="dist", help="output directory (default: dist)")
+    parser.add_argument("--github-user", nargs="+", default=GITHUB_ACCOUNTS,
+                        help="GitHub users/organizations to show (default: GITHUB_ACCOUNTS)")
+    parser.add_argument("--live-url", help="URL of the live app, linked from the Contact page")
+    parser.add_argument("--offline", action="store_true",
+                        help="use the saved repo snapshot without contacting GitHub")
+    args = parser.parse_args()
+
+    export(args.out, args.github_user, args.live_url, refresh=not args.offline)
+    print(f"Static site written to {args.out}/")
+
+
+if __name__ == "__main__":
+    main()
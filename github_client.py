@@ -0,0 +1,356 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import metrics
+
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+
+# Seconds a cached GitHub response is served before it is revalidated
+CACHE_TTL = float(os.getenv("GITHUB_CACHE_TTL", "300"))
+
+# GitHub's maximum page size for list endpoints
+PER_PAGE = 100
+
+# (connect, read) timeouts in seconds so a slow GitHub never blocks a rerun for long
+TIMEOUT = (3.05, 10)
+
+# Once this few API calls are left, stale cache entries are served until the reset
+RATE_LIMIT_FLOOR = int(os.getenv("GITHUB_RATE_LIMIT_FLOOR", "10"))
+
+
+class RateLimitExceeded(requests.exceptions.RequestException):
+    """
+    Raised when the GitHub rate limit is spent and nothing is cached to fall back on
+    """
+
+
+class GraphQLError(requests.exceptions.RequestException):
+    """
+    Raised when a GraphQL query comes back with errors instead of data
+    """
+
+
+class GitHubClient:
+    """
+    Pooled, retrying GitHub REST client with a shared conditional-GET cache.
+
+    All sessions share one client, so they share its keep-alive connections,
+    its response cache and its view of the remaining rate limit.
+    """
+
+    def __init__(self, base_url=GITHUB_API_URL, token=None, cache_ttl=CACHE_TTL,
+                 timeout=TIMEOUT, retries=3, backoff_factor=0.5,
+                 rate_limit_floor=RATE_LIMIT_FLOOR, page_workers=4):
+        self.base_url = base_url.rstrip("/")
+        self.cache_ttl = cache_ttl
+        self.timeout = timeout
+        self.rate_limit_floor = rate_limit_floor
+        self.authenticated = bool(token)
+
+        # Retry connection errors and 5xx replies with exponential backoff.
+        # POST is only used for GraphQL queries, which are reads and safe to repeat.
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=page_workers + 4,
+                              max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "jadontelep-portfolio",
+        })
+        if token:
+            self.session.headers["Authorization"] = f"token {token}"
+
+        # Bounded pool shared by all sessions for fetching the remaining pages
+        self._page_pool = ThreadPoolExecutor(max_workers=page_workers,
+                                             thread_name_prefix="github-pages")
+
+        # url -> entry dict
+        self._cache = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "revalidations": 0, "stale": 0}
+        # X-RateLimit-Resource ("core" for REST, "graphql") -> {"remaining", "reset"};
+        # GitHub budgets each resource separately
+        self.rate_limits = {}
+
+    def url(self, path):
+        """
+        Resolve an API path against the configured base URL
+        """
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def cache_stats(self):
+        """
+        Return a snapshot of the cache counters and the rate limit budget
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._cache)
+            stats["rate_limits"] = {resource: dict(budget) for resource, budget in self.rate_limits.items()}
+        return stats
+
+    def clear_cache(self):
+        """
+        Drop every cached response and reset the counters
+        """
+        with self._lock:
+            self._cache.clear()
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def _count(self, result):
+        # Called with the lock held
+        self._stats[result] += 1
+        metrics.GITHUB_CACHE_LOOKUPS.inc(result=result)
+
+    def _budget_exhausted(self, resource="core"):
+        budget = self.rate_limits.get(resource)
+        if budget is None or budget["remaining"] is None or budget["remaining"] > self.rate_limit_floor:
+            return False
+        return budget["reset"] is None or time.time() < budget["reset"]
+
+    def _rate_limit_error(self, resource):
+        reset = self.rate_limits[resource]["reset"]
+        return RateLimitExceeded(f"GitHub {resource} rate limit exhausted until {reset}")
+
+    def _record_rate_limit(self, response, resource):
+        resource = response.headers.get("X-RateLimit-Resource", resource)
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        budget = self.rate_limits.setdefault(resource, {"remaining": None, "reset": None})
+        if remaining is not None:
+            budget["remaining"] = int(remaining)
+            metrics.GITHUB_RATE_LIMIT_REMAINING.set(budget["remaining"], resource=resource)
+        if reset is not None:
+            budget["reset"] = int(reset)
+            metrics.GITHUB_RATE_LIMIT_RESET.set(budget["reset"], resource=resource)
+
+    def _send(self, method, url, resource="core", **kwargs):
+        """
+        Make one request (retries included), recording its duration, status and
+        the rate limit of its resource
+        """
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        except requests.exceptions.RequestException as e:
+            metrics.GITHUB_REQUEST_ERRORS.inc(method=method, error=type(e).__name__)
+            raise
+        finally:
+            metrics.GITHUB_REQUEST_SECONDS.observe(time.perf_counter() - start, method=method)
+        metrics.GITHUB_REQUESTS.inc(method=method, status=response.status_code)
+        with self._lock:
+            self._record_rate_limit(response, resource)
+        return response
+
+    def get(self, path, headers=None, transform=None):
+        """
+        GET an API path through the shared TTL cache.
+
+        Fresh entries are returned without touching the network. Expired entries
+        are revalidated with If-None-Match / If-Modified-Since, and a 304 reply
+        keeps the cached payload for another TTL. While the rate limit budget is
+        low, expired entries are served as they are instead.
+
+        Returns the decoded JSON payload and the parsed Link header. When a
+        transform is given, it is applied to fresh payloads and its result is
+        what gets cached, so only the data callers need is kept in memory.
+        """
+        url = self.url(path)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cache.get(url)
+            if entry is not None:
+                if now - entry["fetched_at"] < self.cache_ttl:
+                    self._count("hits")
+                    return entry["payload"], entry["links"]
+                if self._budget_exhausted():
+                    self._count("stale")
+                    return entry["payload"], entry["links"]
+            elif self._budget_exhausted():
+                raise self._rate_limit_error("core")
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry["etag"]:
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self._send("GET", url, headers=request_headers)
+
+        with self._lock:
+            if entry is not None and response.status_code == 304:
+                entry["fetched_at"] = time.monotonic()
+                self._count("revalidations")
+                return entry["payload"], entry["links"]
+
+            # Rate limited by GitHub itself: fall back to what we have
+            if entry is not None and response.status_code in (403, 429) and self._budget_exhausted():
+                self._count("stale")
+                return entry["payload"], entry["links"]
+
+            response.raise_for_status()  # Raise an exception for HTTP errors
+            payload = response.json()
+            if transform is not None:
+                payload = transform(payload)
+            self._cache[url] = {
+                "payload": payload,
+                "links": response.links,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.monotonic(),
+            }
+            self._count("misses")
+            return payload, response.links
+
+    def get_text(self, path, accept):
+        """
+        GET a non-JSON representation of an API path (e.g. rendered HTML),
+        bypassing the cache. Callers cache the result under their own key.
+        """
+        with self._lock:
+            if self._budget_exhausted():
+                raise self._rate_limit_error("core")
+        response = self._send("GET", self.url(path), headers={"Accept": accept})
+        response.raise_for_status()
+        return response.text
+
+    def graphql(self, query, variables=None):
+        """
+        Run a GraphQL query against the v4 API and return its data.
+
+        GraphQL needs an authenticated client. Responses are not cached; callers
+        keep whatever they build from the data.
+        """
+        with self._lock:
+            if self._budget_exhausted("graphql"):
+                raise self._rate_limit_error("graphql")
+        response = self._send("POST", self.url("/graphql"), resource="graphql",
+                              json={"query": query, "variables": variables or {}})
+        response.raise_for_status()
+        body = response.json()
+        if body.get("errors"):
+            messages = "; ".join(error.get("message", "unknown error") for error in body["errors"])
+            raise GraphQLError(f"GitHub GraphQL query failed: {messages}", response=response)
+        return body["data"]
+
+    def prime(self, path, payload, etag=None, last_modified=None):
+        """
+        Seed an expired cache entry, e.g. from validators saved by a previous
+        run, so the next get() revalidates it rather than downloading it again
+        """
+        if not etag and not last_modified:
+            return
+        with self._lock:
+            self._cache.setdefault(self.url(path), {
+                "payload": payload,
+                "links": {},
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": float("-inf"),
+            })
+
+    def validators(self, path):
+        """
+        Return the (ETag, Last-Modified) of a cached response, if any
+        """
+        with self._lock:
+            entry = self._cache.get(self.url(path))
+            if entry is None:
+                return None, None
+            return entry["etag"], entry["last_modified"]
+
+    def fetch_pages(self, path, query="", transform=None):
+        """
+        Fetch every page of a GitHub list endpoint as a list of page payloads.
+
+        The first page tells us how many pages there are; the rest are fetched
+        concurrently on the shared pool and returned in page order. Unchanged
+        pages are the very same cached objects on every call.
+        """
+        url = self.url(path)
+        separator = "&" if query else ""
+
+        def page_url(page):
+            return f"{url}?{query}{separator}per_page={PER_PAGE}&page={page}"
+
+        first, links = self.get(page_url(1), transform=transform)
+        last = _last_page(links)
+
+        pages = [first]
+        pages.extend(self._page_pool.map(
+            lambda page: self.get(page_url(page), transform=transform)[0],
+            range(2, last + 1),
+        ))
+
+        # A cached first page can carry a stale Link header; keep going while
+        # the final page is full in case the account grew past it
+        page = last
+        while len(pages[-1]) == PER_PAGE:
+            page += 1
+            pages.append(self.get(page_url(page), transform=transform)[0])
+
+        return pages
+
+    def iter_pages(self, path, query="", transform=None):
+        """
+        Yield the pages of a GitHub list endpoint one at a time, fetching each
+        only when it is consumed, so a caller can stop after the first few
+        """
+        url = self.url(path)
+        separator = "&" if query else ""
+        page = 1
+        while True:
+            items, _ = self.get(f"{url}?{query}{separator}per_page={PER_PAGE}&page={page}",
+                                transform=transform)
+            yield items
+            if len(items) < PER_PAGE:
+                return
+            page += 1
+
+
+def _last_page(links):
+    """
+    Read the last page number from a parsed Link header (1 if there is none)
+    """
+    last = links.get("last")
+    if not last:
+        return 1
+    query = parse_qs(urlparse(last["url"]).query)
+    return int(query.get("page", ["1"])[0])
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """
+    Return the process-wide GitHub client, creating it on first use
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = GitHubClient(
+                token=os.getenv("GITHUB_TOKEN", ""),
+                page_workers=int(os.getenv("GITHUB_PAGE_WORKERS", "4")),
+            )
+            metrics.GITHUB_CACHE_ENTRIES.set_function(lambda: len(_client._cache))
+        return _client
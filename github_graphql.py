@@ -0,0 +1,57 @@
+from github_client import PER_PAGE, GraphQLError, get_client
+from repo_records import records_from_graphql
+
+# Every public repo an account owns, with the metadata the REST listing lacks,
+# in pages of up to 100 repos per request
+REPOS_QUERY = """
+query($login: String!, $first: Int!, $after: String, $orderBy: RepositoryOrderField!) {
+  repositoryOwner(login: $login) {
+    repositories(first: $first, after: $after, privacy: PUBLIC, ownerAffiliations: [OWNER],
+                 orderBy: {field: $orderBy, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        databaseId
+        name
+        description
+        url
+        createdAt
+        updatedAt
+        stargazerCount
+        forkCount
+        issues(states: OPEN) { totalCount }
+        pullRequests(states: OPEN) { totalCount }
+        primaryLanguage { name }
+        languages(first: 10, orderBy: {field: SIZE, direction: DESC}) {
+          edges { size node { name } }
+        }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        defaultBranchRef { target { ... on Commit { committedDate } } }
+      }
+    }
+  }
+}
+"""
+
+
+def iter_repo_pages(login, order_by="UPDATED_AT", client=None):
+    """
+    Yield every public repo of a user or organization, with languages, topics
+    and the last commit date, as pages of RepoRecord in descending order_by
+    (a RepositoryOrderField). Pages are only requested as they are consumed.
+
+    Raises requests.exceptions.RequestException when GitHub can't be reached
+    or the account doesn't exist.
+    """
+    client = client or get_client()
+    after = None
+    while True:
+        data = client.graphql(REPOS_QUERY, {"login": login, "first": PER_PAGE, "after": after,
+                                            "orderBy": order_by})
+        owner = data.get("repositoryOwner")
+        if owner is None:
+            raise GraphQLError(f"GitHub account {login} not found")
+        repositories = owner["repositories"]
+        yield records_from_graphql(repositories["nodes"])
+        if not repositories["pageInfo"]["hasNextPage"]:
+            return
+        after = repositories["pageInfo"]["endCursor"]
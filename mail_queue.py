@@ -0,0 +1,250 @@
+import logging
+import os
+import queue
+import smtplib
+import threading
+import time
+import uuid
+from email import message_from_bytes, policy
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))  # TLS port
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "1") == "1"
+
+# Messages wait here on disk until they are delivered, so they survive restarts
+SPOOL_DIR = os.getenv("MAIL_SPOOL_DIR", ".mail_spool")
+
+
+class MailQueue:
+    """
+    Background email delivery backed by an on-disk spool.
+
+    enqueue() writes the message to the spool and returns immediately. A single
+    worker thread keeps one authenticated SMTP connection open, sends queued
+    messages in batches and retries failed batches with exponential backoff.
+    Messages the server rejects, or that still fail after max_retries, are
+    moved to the spool's failed/ directory. While the server can't be reached
+    or refuses the login, messages stay spooled and connecting is retried.
+    """
+
+    def __init__(self, username, password, host=SMTP_HOST, port=SMTP_PORT,
+                 starttls=SMTP_STARTTLS, spool_dir=SPOOL_DIR, batch_size=10,
+                 max_retries=5, backoff=1.0, idle_timeout=60.0, timeout=30.0):
+        self.username = username
+        self.password = password
+        self.host = host
+        self.port = port
+        self.starttls = starttls
+        self.spool_dir = spool_dir
+        self.failed_dir = os.path.join(spool_dir, "failed")
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+
+        self._queue = queue.Queue()
+        self._smtp = None
+        self._thread = None
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._stats = {"queued": 0, "sent": 0, "failed": 0, "retries": 0, "connections": 0}
+
+        # Re-queue anything left in the spool by a previous run
+        os.makedirs(self.failed_dir, exist_ok=True)
+        for name in sorted(os.listdir(self.spool_dir)):
+            if name.endswith(".eml"):
+                self._queue.put(name)
+                self._count("queued")
+
+    def start(self):
+        """
+        Start the delivery worker
+        """
+        if self._thread is not None:
+            return self
+        self._thread = threading.Thread(target=self._run, name="mail-queue", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        """
+        Ask the worker to finish and close the SMTP connection
+        """
+        self._stopping.set()
+        self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def enqueue(self, msg):
+        """
+        Spool an EmailMessage for delivery and return its spool id
+        """
+        name = f"{time.time_ns()}-{uuid.uuid4().hex}.eml"
+        path = os.path.join(self.spool_dir, name)
+        # Write then rename so the worker never sees a half-written message
+        with open(path + ".tmp", "wb") as f:
+            f.write(msg.as_bytes(policy=policy.SMTP))
+        os.replace(path + ".tmp", path)
+        self._queue.put(name)
+        self._count("queued")
+        return name
+
+    def pending(self):
+        """
+        Number of messages waiting for delivery
+        """
+        return self._queue.qsize()
+
+    def stats(self):
+        """
+        Return a snapshot of the delivery counters
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["pending"] = self.pending()
+        return stats
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self._stats[key] += amount
+
+    def _run(self):
+        while True:
+            try:
+                name = self._queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                # Nothing to send for a while; don't hold the connection open
+                self._disconnect()
+                continue
+            if name is None:
+                break
+
+            batch = [name]
+            while len(batch) < self.batch_size:
+                try:
+                    name = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if name is None:
+                    self._stopping.set()
+                    break
+                batch.append(name)
+
+            self._send_batch(batch)
+            if self._stopping.is_set():
+                break
+        self._disconnect()
+
+    def _connect(self):
+        if self._smtp is not None:
+            return self._smtp
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                smtp.starttls()  # Secure the connection
+            if self.username and self.password:
+                smtp.login(self.username, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        self._smtp = smtp
+        self._count("connections")
+        return smtp
+
+    def _disconnect(self):
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+    def _send_batch(self, batch):
+        attempt = 0
+        connect_attempt = 0
+        while batch:
+            try:
+                smtp = self._connect()
+            except OSError as e:
+                # Connect, STARTTLS or login failed: nothing is wrong with the
+                # messages, so they stay spooled until the server takes them
+                metrics.SMTP_SEND_FAILURES.inc(kind="connect")
+                logger.warning("Could not connect to the SMTP server, %d message(s) waiting: %s",
+                               len(batch), e)
+                connect_attempt += 1
+                if not self._back_off(connect_attempt):
+                    return
+                continue
+            connect_attempt = 0
+
+            try:
+                while batch:
+                    self._send_one(smtp, batch[0])
+                    batch.pop(0)
+            except OSError as e:  # smtplib.SMTPException is an OSError too
+                self._disconnect()
+                if not _is_transient(e):
+                    # Rejected by the server (bad recipient, sender, ...): don't retry this message
+                    metrics.SMTP_SEND_FAILURES.inc(kind="permanent")
+                    logger.error("SMTP server rejected %s: %s", batch[0], e)
+                    self._fail(batch.pop(0))
+                    continue
+                metrics.SMTP_SEND_FAILURES.inc(kind="transient")
+                attempt += 1
+                if attempt > self.max_retries:
+                    metrics.SMTP_SEND_FAILURES.inc(len(batch), kind="gave_up")
+                    logger.error("Giving up on %d queued message(s): %s", len(batch), e)
+                    for name in batch:
+                        self._fail(name)
+                    return
+                if not self._back_off(attempt):
+                    return
+
+    def _back_off(self, attempt):
+        """
+        Wait before retry number attempt; False when stopping, leaving the
+        rest of the batch in the spool for the next run
+        """
+        if self._stopping.is_set():
+            return False
+        self._count("retries")
+        delay = self.backoff * 2 ** (min(attempt, self.max_retries) - 1)
+        return not self._stopping.wait(delay)
+
+    def _send_one(self, smtp, name):
+        path = os.path.join(self.spool_dir, name)
+        try:
+            with open(path, "rb") as f:
+                msg = message_from_bytes(f.read(), policy=policy.default)
+        except FileNotFoundError:
+            return  # Already delivered and removed
+        with metrics.SMTP_SEND_SECONDS.time():
+            smtp.send_message(msg)
+        os.remove(path)
+        self._count("sent")
+        logger.info("Email %s sent successfully", name)
+
+    def _fail(self, name):
+        try:
+            os.replace(os.path.join(self.spool_dir, name), os.path.join(self.failed_dir, name))
+        except FileNotFoundError:
+            pass
+        self._count("failed")
+
+
+def _is_transient(error):
+    """
+    Whether a failed send is worth retrying: network trouble and 4xx replies are
+    """
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return False
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    return True
@@ -0,0 +1,282 @@
+"""
+Operational metrics in the Prometheus text format.
+
+Metrics are recorded in-process by the GitHub client, the mail queue, the
+contact form and app.py, and exposed either on a small HTTP endpoint
+(METRICS_PORT, scraped at /metrics) or as a file for node_exporter's textfile
+collector (METRICS_FILE, rewritten every METRICS_INTERVAL seconds). Both are
+off unless configured.
+"""
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+METRICS_FILE = os.getenv("METRICS_FILE", "")
+METRICS_INTERVAL = float(os.getenv("METRICS_INTERVAL", "15"))
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; covers cached reruns (milliseconds) up to slow GitHub or SMTP calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_registry = []
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs.extend(f'{name}="{value}"' for name, value in extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value):
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        # label values -> value (histograms: (bucket counts, sum, count))
+        self._values = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def _key(self, labels):
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self):
+        with self._lock:
+            return [(key, value) for key, value in self._values.items()]
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for key, value in sorted(self.samples()):
+            lines.append(f"{self.name}{_labels(self.labelnames, key)} {_number(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._function = None
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def set_function(self, function):
+        """
+        Read the (unlabelled) value from function at scrape time; None skips it
+        """
+        self._function = function
+
+    def samples(self):
+        if self._function is None:
+            return super().samples()
+        try:
+            value = self._function()
+        except Exception as e:  # A broken callback must not break the scrape
+            logger.debug("Reading %s failed: %s", self.name, e)
+            return []
+        return [] if value is None else [((), value)]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets) + (math.inf,)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key) or ([0] * len(self.buckets), 0.0, 0)
+            # Copy, so a scrape rendering the old counts outside the lock never sees a torn update
+            counts = list(counts)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._values[key] = (counts, total + value, count + 1)
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for key, (counts, total, count) in sorted(self.samples()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _labels(self.labelnames, key, [("le", _number(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_number(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+# GitHub
+GITHUB_REQUESTS = Counter(
+    "portfolio_github_requests_total", "GitHub API responses by method and HTTP status",
+    ["method", "status"])
+GITHUB_REQUEST_ERRORS = Counter(
+    "portfolio_github_request_errors_total", "GitHub API requests that got no response",
+    ["method", "error"])
+GITHUB_REQUEST_SECONDS = Histogram(
+    "portfolio_github_request_duration_seconds", "Duration of GitHub API requests", ["method"])
+GITHUB_FETCH_SECONDS = Histogram(
+    "portfolio_github_repos_fetch_duration_seconds", "Duration of fetching an account's repo list",
+    ["account"])
+GITHUB_FETCH_ERRORS = Counter(
+    "portfolio_github_repos_fetch_errors_total", "Failed fetches of an account's repo list",
+    ["account", "error"])
+GITHUB_CACHE_LOOKUPS = Counter(
+    "portfolio_github_cache_lookups_total",
+    "GitHub client cache lookups: hits (fresh), revalidations (304), stale (served while "
+    "rate limited) and misses (downloaded)", ["result"])
+GITHUB_CACHE_ENTRIES = Gauge(
+    "portfolio_github_cache_entries", "Responses held in the GitHub client cache")
+GITHUB_RATE_LIMIT_REMAINING = Gauge(
+    "portfolio_github_rate_limit_remaining",
+    "GitHub API calls left in the current window, by resource (core, graphql)", ["resource"])
+GITHUB_RATE_LIMIT_RESET = Gauge(
+    "portfolio_github_rate_limit_reset_timestamp_seconds",
+    "When the GitHub rate limit window of a resource resets", ["resource"])
+
+# Contact form and mail delivery
+CONTACT_SUBMISSIONS = Counter(
+    "portfolio_contact_submissions_total", "Contact form submissions by outcome", ["result"])
+SMTP_SEND_SECONDS = Histogram(
+    "portfolio_smtp_send_duration_seconds", "Duration of sending one message over SMTP")
+SMTP_SEND_FAILURES = Counter(
+    "portfolio_smtp_send_failures_total",
+    "Failed SMTP sends: connect (connect or login failed, retried), transient (retried), "
+    "permanent or given up after retries", ["kind"])
+MAIL_QUEUE_PENDING = Gauge(
+    "portfolio_mail_queue_pending", "Messages waiting in the spool for delivery")
+
+# Reruns and sessions
+# The histogram's _count is the number of reruns per page
+RERUN_SECONDS = Histogram(
+    "portfolio_rerun_duration_seconds", "Duration of a script rerun by page", ["page"])
+ACTIVE_SESSIONS = Gauge("portfolio_active_sessions", "Browser sessions connected to the app")
+
+
+def active_sessions():
+    """
+    Number of sessions connected to the Streamlit runtime, if it is running
+    """
+    from streamlit.runtime import Runtime
+
+    if not Runtime.exists():
+        return None
+    return Runtime.instance()._session_mgr.num_active_sessions()
+
+
+ACTIVE_SESSIONS.set_function(active_sessions)
+
+
+def render():
+    """
+    All metrics in the Prometheus text exposition format
+    """
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path):
+    """
+    Write the metrics for node_exporter's textfile collector, atomically
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(render())
+    os.replace(tmp_path, path)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+_started = False
+_start_lock = threading.Lock()
+
+
+def start(port=METRICS_PORT, path=METRICS_FILE, interval=METRICS_INTERVAL):
+    """
+    Start the configured exporters, once per process
+    """
+    global _started
+    with _start_lock:
+        if _started:
+            return
+        _started = True
+
+        if port:
+            try:
+                server = ThreadingHTTPServer(("0.0.0.0", port), _Handler)
+            except OSError as e:
+                logger.warning("Could not serve metrics on port %s: %s", port, e)
+            else:
+                server.daemon_threads = True
+                threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+
+        if path:
+            def write_forever():
+                while True:
+                    try:
+                        write_textfile(path)
+                    except OSError as e:
+                        logger.warning("Could not write metrics to %s: %s", path, e)
+                    time.sleep(interval)
+
+            threading.Thread(target=write_forever, name="metrics-textfile", daemon=True).start()
@@ -0,0 +1,162 @@
+import cProfile
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+import streamlit as st
+
+# Profile every rerun, not only those opened with ?profile=1
+PROFILE_ALL = os.getenv("PORTFOLIO_PROFILE", "0") == "1"
+
+# When set, each profiled rerun writes <stamp>-<page>.prof (cProfile/pstats)
+# and <stamp>-<page>.folded (collapsed stacks for flamegraph.pl or speedscope)
+PROFILE_DIR = os.getenv("PORTFOLIO_PROFILE_DIR", "")
+
+# Each Streamlit session reruns the script on its own thread
+_local = threading.local()
+
+
+class Span:
+    """
+    One timed section of a rerun and the sections nested inside it
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.start = time.perf_counter()
+        self.duration = None
+        self.children = []
+
+    @property
+    def self_time(self):
+        return self.duration - sum(child.duration for child in self.children)
+
+
+class RerunProfile:
+    """
+    Span tree (and optionally a cProfile run) for a single rerun of the app
+    """
+
+    def __init__(self, name, with_cprofile=False):
+        self.root = Span(name)
+        self._stack = [self.root]
+        self.cprofile = None
+        if with_cprofile:
+            self.cprofile = cProfile.Profile()
+            try:
+                self.cprofile.enable()
+            except ValueError:
+                # Another session's profiler already owns the interpreter
+                self.cprofile = None
+
+    @contextmanager
+    def span(self, name):
+        node = Span(name)
+        self._stack[-1].children.append(node)
+        self._stack.append(node)
+        try:
+            yield node
+        finally:
+            node.duration = time.perf_counter() - node.start
+            self._stack.pop()
+
+    def finish(self):
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        self.root.duration = time.perf_counter() - self.root.start
+        return self
+
+    def lines(self):
+        """
+        Indented text rendering of the span tree in milliseconds
+        """
+        out = []
+
+        def walk(node, depth):
+            out.append(f"{'  ' * depth}{node.name:<{32 - 2 * depth}} {node.duration * 1000:9.2f} ms")
+            for child in node.children:
+                walk(child, depth + 1)
+
+        walk(self.root, 0)
+        return out
+
+    def folded(self):
+        """
+        Collapsed stack lines ("a;b;c <self microseconds>") for flame graphs
+        """
+        out = []
+
+        def walk(node, prefix):
+            stack = f"{prefix};{node.name}" if prefix else node.name
+            out.append(f"{stack} {max(int(node.self_time * 1e6), 0)}")
+            for child in node.children:
+                walk(child, stack)
+
+        walk(self.root, "")
+        return out
+
+    def dump(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S") + f"-{time.time_ns() % 1_000_000:06d}"
+        base = os.path.join(directory, f"{stamp}-{self.root.name.replace(' ', '_')}")
+        with open(base + ".folded", "w") as f:
+            f.write("\n".join(self.folded()) + "\n")
+        if self.cprofile is not None:
+            self.cprofile.dump_stats(base + ".prof")
+        return base
+
+
+def is_enabled():
+    """
+    Profiling is opt-in: PORTFOLIO_PROFILE=1 or ?profile=1 in the URL
+    """
+    return PROFILE_ALL or _query_param("profile") == "1"
+
+
+def _query_param(name):
+    # st.query_params arrived in Streamlit 1.30; older versions return lists
+    query_params = getattr(st, "query_params", None)
+    if query_params is not None:
+        return query_params.get(name)
+    values = st.experimental_get_query_params().get(name)
+    return values[0] if values else None
+
+
+def start_rerun(name="rerun"):
+    """
+    Begin profiling the current rerun if profiling is enabled
+    """
+    _local.profile = RerunProfile(name, with_cprofile=bool(PROFILE_DIR)) if is_enabled() else None
+    return _local.profile
+
+
+def span(name):
+    """
+    Time a section of the current rerun; a no-op when profiling is off
+    """
+    profile = getattr(_local, "profile", None)
+    if profile is None:
+        return nullcontext()
+    return profile.span(name)
+
+
+def finish_rerun(name=None):
+    """
+    Close the current rerun's profile, dump it if configured and show the panel
+    """
+    profile = getattr(_local, "profile", None)
+    _local.profile = None
+    if profile is None:
+        return None
+    if name:
+        profile.root.name = name
+    profile.finish()
+    if PROFILE_DIR:
+        profile.dump(PROFILE_DIR)
+
+    with st.sidebar.expander("Render profile", expanded=True):
+        st.code("\n".join(profile.lines()), language=None)
+        st.download_button("Download folded stacks", "\n".join(profile.folded()) + "\n",
+                           file_name=f"{profile.root.name}.folded")
+    return profile
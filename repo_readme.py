@@ -0,0 +1,181 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from github_client import get_client
+from repo_refresher import SNAPSHOT_DIR
+
+logger = logging.getLogger(__name__)
+
+# Rendered READMEs, one file per git blob SHA, plus the saved request validators
+README_DIR = os.path.join(SNAPSHOT_DIR, "readmes")
+
+# Rendered READMEs kept in memory across sessions
+MAX_IN_MEMORY = 32
+
+# Media type for GitHub's own (sanitized) HTML rendering of a README
+HTML_MEDIA_TYPE = "application/vnd.github.html+json"
+
+# Relative src/href targets in README HTML, which only resolve on github.com
+_RELATIVE_LINK = re.compile(r'(?P<attr>src|href)="(?!(?:[a-z][a-z0-9+.-]*:|#|/))(?:\./)?(?P<path>[^"]+)"')
+
+
+def _blob_sha(readme):
+    # Only the SHA of the README metadata is kept; the base64 content is dropped
+    return readme["sha"]
+
+
+def _absolute_links(html, full_name):
+    """
+    Point relative image and link targets at the repo on GitHub
+    """
+    def absolute(match):
+        if match["attr"] == "src":
+            base = f"https://raw.githubusercontent.com/{full_name}/HEAD/"
+        else:
+            base = f"https://github.com/{full_name}/blob/HEAD/"
+        return f'{match["attr"]}="{base}{match["path"]}"'
+
+    return _RELATIVE_LINK.sub(absolute, html)
+
+
+class ReadmeCache:
+    """
+    Rendered README previews, content-addressed by the README's git blob SHA.
+
+    Looking up a repo costs one conditional request for the README metadata,
+    which is a 304 while the README is unchanged. The HTML itself is only
+    downloaded (rendered by GitHub) when the SHA is new. Rendered HTML and the
+    validators of the metadata requests are saved to disk, so a restart
+    revalidates instead of re-downloading, and repos sharing a README share it.
+    """
+
+    def __init__(self, cache_dir=README_DIR, client=None, workers=2):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.client = client or get_client()
+        # sha -> rendered HTML, least recently used first
+        self._html = OrderedDict()
+        # API path -> {"sha", "etag", "last_modified"}
+        self._index = {}
+        # API path -> monotonic time GitHub said the repo has no README
+        self._missing = {}
+        # full name -> prefetch future
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="readme-prefetch")
+        self._load_index()
+
+    def get(self, full_name):
+        """
+        Return the README of a repo as HTML, or None if it has none.
+
+        Raises requests.exceptions.RequestException when GitHub can't be reached.
+        """
+        path = f"/repos/{full_name}/readme"
+        with self._lock:
+            missing_at = self._missing.get(path)
+        if missing_at is not None and time.monotonic() - missing_at < self.client.cache_ttl:
+            return None
+
+        try:
+            sha, _ = self.client.get(path, transform=_blob_sha)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                with self._lock:
+                    self._missing[path] = time.monotonic()
+                return None
+            raise
+        self._remember(path, sha)
+
+        html = self._load_html(sha)
+        if html is None:
+            html = self.client.get_text(path, accept=HTML_MEDIA_TYPE)
+            self._store_html(sha, html)
+        return _absolute_links(html, full_name)
+
+    def prefetch(self, full_names):
+        """
+        Warm the cache for the given repos on background threads
+        """
+        with self._lock:
+            for full_name in full_names:
+                if full_name not in self._pending:
+                    future = self._pool.submit(self._prefetch_one, full_name)
+                    self._pending[full_name] = future
+
+    def _prefetch_one(self, full_name):
+        try:
+            self.get(full_name)
+        except requests.exceptions.RequestException as e:
+            logger.debug("Prefetching the README of %s failed: %s", full_name, e)
+        finally:
+            with self._lock:
+                self._pending.pop(full_name, None)
+
+    def _remember(self, path, sha):
+        etag, last_modified = self.client.validators(path)
+        entry = {"sha": sha, "etag": etag, "last_modified": last_modified}
+        with self._save_lock:
+            with self._lock:
+                if self._index.get(path) == entry:
+                    return
+                self._index[path] = entry
+                index = dict(self._index)
+            self._write(self.index_path, json.dumps(index))
+
+    def _load_index(self):
+        try:
+            with open(self.index_path) as f:
+                self._index = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable README index %s: %s", self.index_path, e)
+            return
+        # Let the first lookup of each README after a restart be a conditional request
+        for path, entry in self._index.items():
+            self.client.prime(path, entry["sha"], entry["etag"], entry["last_modified"])
+
+    def _load_html(self, sha):
+        with self._lock:
+            html = self._html.get(sha)
+            if html is not None:
+                self._html.move_to_end(sha)
+                return html
+        try:
+            with open(os.path.join(self.cache_dir, f"{sha}.html")) as f:
+                html = f.read()
+        except OSError:
+            return None
+        self._keep(sha, html)
+        return html
+
+    def _store_html(self, sha, html):
+        self._keep(sha, html)
+        self._write(os.path.join(self.cache_dir, f"{sha}.html"), html)
+
+    def _keep(self, sha, html):
+        with self._lock:
+            self._html[sha] = html
+            self._html.move_to_end(sha)
+            while len(self._html) > MAX_IN_MEMORY:
+                self._html.popitem(last=False)
+
+    def _write(self, path, text):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not save %s: %s", path, e)
@@ -0,0 +1,193 @@
+import heapq
+import itertools
+import sys
+from operator import attrgetter
+
+# Every new RepoIndex gets the next revision, so views derived from one can be memoized
+_revisions = itertools.count(1)
+
+
+class RepoRecord:
+    """
+    The handful of GitHub repository fields the portfolio actually shows
+    """
+
+    __slots__ = ("id", "name", "description", "language", "created_at", "updated_at",
+                 "url", "stars", "forks", "watchers", "open_issues",
+                 "topics", "languages", "last_commit_at")
+
+    def __init__(self, id, name, description, language, created_at, updated_at,
+                 url, stars, forks, watchers, open_issues,
+                 topics=None, languages=None, last_commit_at=None):
+        self.id = id
+        self.name = name
+        self.description = description
+        self.language = language
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.url = url
+        self.stars = stars
+        self.forks = forks
+        self.watchers = watchers
+        self.open_issues = open_issues
+        # Only filled in by the GraphQL backend, except topics which REST has too
+        self.topics = topics
+        self.languages = languages
+        self.last_commit_at = last_commit_at
+
+    @classmethod
+    def from_github(cls, repo):
+        """
+        Build a record from one item of the GitHub REST repos listing
+        """
+        language = repo.get("language")
+        return cls(
+            id=repo["id"],
+            name=repo["name"],
+            description=repo.get("description"),
+            # A few languages repeat across every repo, share the strings
+            language=sys.intern(language) if language else None,
+            created_at=repo["created_at"],
+            updated_at=repo["updated_at"],
+            url=repo["html_url"],
+            stars=repo.get("stargazers_count", 0),
+            forks=repo.get("forks_count", 0),
+            watchers=repo.get("watchers_count", 0),
+            open_issues=repo.get("open_issues_count", 0),
+            topics=repo.get("topics") or None,
+        )
+
+    @classmethod
+    def from_graphql(cls, node):
+        """
+        Build a record from one repository node of the GraphQL repos query
+        """
+        language = (node.get("primaryLanguage") or {}).get("name")
+        languages = {
+            edge["node"]["name"]: edge["size"] for edge in (node.get("languages") or {}).get("edges", [])
+        }
+        topics = [item["topic"]["name"] for item in (node.get("repositoryTopics") or {}).get("nodes", [])]
+        commit = ((node.get("defaultBranchRef") or {}).get("target")) or {}
+        return cls(
+            id=node["databaseId"],
+            name=node["name"],
+            description=node.get("description"),
+            language=sys.intern(language) if language else None,
+            created_at=node["createdAt"],
+            updated_at=node["updatedAt"],
+            url=node["url"],
+            stars=node.get("stargazerCount", 0),
+            forks=node.get("forkCount", 0),
+            # REST reports the star count as watchers_count; keep the two backends alike
+            watchers=node.get("stargazerCount", 0),
+            # and counts open pull requests as open issues
+            open_issues=node["issues"]["totalCount"] + node["pullRequests"]["totalCount"],
+            topics=topics or None,
+            languages=languages or None,
+            last_commit_at=commit.get("committedDate"),
+        )
+
+    @property
+    def full_name(self):
+        """
+        "owner/name", taken from the repo URL so older snapshots have it too
+        """
+        return self.url.split("github.com/", 1)[-1]
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{field: data.get(field) for field in cls.__slots__})
+
+    def __repr__(self):
+        return f"RepoRecord({self.name!r}, stars={self.stars})"
+
+
+def records_from_github(repos):
+    """
+    Convert a page of the GitHub REST repos listing into records
+    """
+    return [RepoRecord.from_github(repo) for repo in repos]
+
+
+def records_from_graphql(nodes):
+    """
+    Convert a page of GraphQL repository nodes into records
+    """
+    return [RepoRecord.from_graphql(node) for node in nodes]
+
+
+class RepoIndex:
+    """
+    Immutable, star-sorted list of repo records with O(1) lookup by name.
+
+    One index is shared by every session showing the same set of repos. When
+    the repos belong to more than one account they are named "owner/name".
+    """
+
+    __slots__ = ("records", "by_name", "positions", "qualified", "revision")
+
+    def __init__(self, records, presorted=False):
+        if presorted:
+            self.records = tuple(records)
+        else:
+            # Sort repos by stars in descending order
+            self.records = tuple(sorted(records, key=lambda record: record.stars, reverse=True))
+        owners = {record.full_name.split("/", 1)[0].lower() for record in self.records}
+        self.qualified = len(owners) > 1
+        self.by_name = {self._name(record): record for record in self.records}
+        # name -> index in records, for neighbours() without scanning
+        self.positions = {self._name(record): position for position, record in enumerate(self.records)}
+        self.revision = next(_revisions)
+
+    def _name(self, record):
+        return record.full_name if self.qualified else record.name
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __bool__(self):
+        return bool(self.records)
+
+    def names(self):
+        return [self._name(record) for record in self.records]
+
+    def get(self, name):
+        return self.by_name.get(name)
+
+    def neighbours(self, name, distance=1):
+        """
+        Records up to distance places before and after name, nearest first
+        """
+        position = self.positions.get(name)
+        if position is None:
+            return []
+        around = []
+        for offset in range(1, distance + 1):
+            if position + offset < len(self.records):
+                around.append(self.records[position + offset])
+            if position - offset >= 0:
+                around.append(self.records[position - offset])
+        return around
+
+
+def merge_indexes(indexes):
+    """
+    Merge the indexes of several accounts into one, dropping repeated repos.
+
+    Each index is already sorted by stars, so a k-way merge keeps the order
+    without sorting all the repos again.
+    """
+    seen = set()
+    merged = []
+    for record in heapq.merge(*(index.records for index in indexes),
+                              key=attrgetter("stars"), reverse=True):
+        if record.id not in seen:
+            seen.add(record.id)
+            merged.append(record)
+    return RepoIndex(merged, presorted=True)
@@ -0,0 +1,165 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+from repo_records import RepoIndex, RepoRecord, merge_indexes
+from utils import fetch_repo_index, fetch_repo_indexes
+
+logger = logging.getLogger(__name__)
+
+# Seconds between background refreshes of the repo list
+REFRESH_INTERVAL = float(os.getenv("GITHUB_REFRESH_INTERVAL", os.getenv("GITHUB_CACHE_TTL", "300")))
+
+# Last good repo list per account is kept here so restarts start warm
+SNAPSHOT_DIR = os.getenv("GITHUB_SNAPSHOT_DIR", ".cache")
+
+
+class RepoRefresher:
+    """
+    Keeps the repo list of one or more accounts fresh on a background thread.
+
+    Page renders call snapshot(), which returns the last good RepoIndex right
+    away. At start the snapshots persisted by a previous run are loaded from
+    disk, then a daemon thread fetches from GitHub immediately and again every
+    interval, all accounts concurrently. An account whose refresh fails keeps
+    serving its previous snapshot; the others are unaffected.
+    """
+
+    def __init__(self, usernames, interval=REFRESH_INTERVAL, snapshot_dir=SNAPSHOT_DIR,
+                 fetch=fetch_repo_index):
+        if isinstance(usernames, str):
+            usernames = [usernames]
+        self.usernames = list(usernames)
+        self.interval = interval
+        self.snapshot_dir = snapshot_dir
+        self.fetch = fetch
+        # username -> exception of its last failed refresh; replaced, never
+        # mutated, so sessions can iterate it while a refresh runs
+        self.errors = {}
+        self.refreshed_at = None
+        # username -> RepoIndex of that account, and all of them merged
+        self._indexes = {}
+        self._index = None
+        self._ready = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    @property
+    def last_error(self):
+        """
+        Error of the first account that failed its last refresh, if any
+        """
+        return next(iter(self.errors.values()), None)
+
+    def snapshot_path(self, username):
+        return os.path.join(self.snapshot_dir, f"github_repos_{username}.json")
+
+    def start(self):
+        """
+        Load the on-disk snapshots and start refreshing in the background
+        """
+        if self._thread is not None:
+            return self
+        self.load_snapshot()
+        name = f"repo-refresher-{'+'.join(self.usernames)}"
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopping.set()
+
+    def snapshot(self, timeout=0):
+        """
+        Return the last good RepoIndex, or None if nothing has been fetched yet.
+
+        Only when there is no snapshot at all (first ever start) does this wait,
+        up to timeout seconds, for the warm-up fetch.
+        """
+        if self._index is None and timeout:
+            self._ready.wait(timeout)
+        return self._index
+
+    def refresh(self):
+        """
+        Fetch every account now; returns False if any could not be reached
+        """
+        results = fetch_repo_indexes(self.usernames, fetch=self.fetch)
+
+        changed = False
+        errors = {}
+        for username, result in results.items():
+            if isinstance(result, Exception):  # Keep serving the last good snapshot
+                logger.warning("Refreshing repositories for %s failed: %s", username, result)
+                errors[username] = result
+                continue
+            if result is not self._indexes.get(username):
+                self._indexes[username] = result
+                self._save_snapshot(username, result)
+                changed = True
+
+        self.errors = errors
+        if changed:
+            self._merge()
+        if len(self.errors) < len(self.usernames):
+            self.refreshed_at = time.time()
+        if self._index is not None:
+            self._ready.set()
+        return not self.errors
+
+    def _merge(self):
+        indexes = [self._indexes[username] for username in self.usernames if username in self._indexes]
+        self._index = indexes[0] if len(indexes) == 1 else merge_indexes(indexes)
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self.refresh()
+            self._stopping.wait(self.interval)
+
+    def load_snapshot(self):
+        """
+        Load the repo lists saved by a previous run, if there are any
+        """
+        for username in self.usernames:
+            path = self.snapshot_path(username)
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring unreadable repo snapshot %s: %s", path, e)
+                continue
+            self._indexes[username] = RepoIndex(RepoRecord.from_dict(repo) for repo in data["repos"])
+            saved_at = data.get("saved_at")
+            if saved_at and (self.refreshed_at is None or saved_at > self.refreshed_at):
+                self.refreshed_at = saved_at
+        if self._indexes:
+            self._merge()
+            self._ready.set()
+
+    def _save_snapshot(self, username, index):
+        data = {
+            "username": username,
+            "saved_at": time.time(),
+            "repos": [record.to_dict() for record in index],
+        }
+        path = self.snapshot_path(username)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not save repo snapshot %s: %s", path, e)
+
+
+if __name__ == "__main__":
+    # Pre-warm the on-disk snapshots, e.g. as a deploy build step:
+    #   python repo_refresher.py jadontelep some-org
+    ok = RepoRefresher(sys.argv[1:]).refresh()
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,215 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from repo_records import RepoRecord
+
+logger = logging.getLogger(__name__)
+
+# Local copy of every synced account's repos
+REPO_STORE_PATH = os.getenv(
+    "GITHUB_REPO_STORE", os.path.join(os.getenv("GITHUB_SNAPSHOT_DIR", ".cache"), "repos.sqlite3"))
+
+# Seconds between full syncs, which refresh stars, forks and other counts of
+# repos whose updated_at didn't move, and notice deleted repos
+FULL_SYNC_INTERVAL = float(os.getenv("GITHUB_FULL_SYNC_INTERVAL", "3600"))
+
+FIELDS = RepoRecord.__slots__
+
+# Stored as JSON text
+_JSON_FIELDS = ("topics", "languages")
+
+SORTS = {
+    "updated": "updated_at DESC",
+    "stars": "stars DESC",
+    "name": "name COLLATE NOCASE ASC",
+}
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS repos (
+    id INTEGER PRIMARY KEY,
+    account TEXT NOT NULL,
+    {", ".join(f"{field} {'INTEGER' if field in ('stars', 'forks', 'watchers', 'open_issues') else 'TEXT'}"
+               for field in FIELDS if field != "id")}
+);
+CREATE INDEX IF NOT EXISTS repos_account ON repos (account);
+CREATE INDEX IF NOT EXISTS repos_name ON repos (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS repos_language ON repos (language);
+CREATE INDEX IF NOT EXISTS repos_stars ON repos (stars);
+CREATE INDEX IF NOT EXISTS repos_updated_at ON repos (updated_at);
+CREATE TABLE IF NOT EXISTS sync_state (
+    account TEXT PRIMARY KEY,
+    synced_at REAL,
+    full_synced_at REAL
+);
+"""
+
+
+def _row(account, record):
+    values = [account]
+    for field in FIELDS:
+        value = getattr(record, field)
+        values.append(json.dumps(value) if field in _JSON_FIELDS and value is not None else value)
+    return values
+
+
+def _record(row):
+    data = dict(zip(FIELDS, row))
+    for field in _JSON_FIELDS:
+        if data[field] is not None:
+            data[field] = json.loads(data[field])
+    return RepoRecord.from_dict(data)
+
+
+class RepoStore:
+    """
+    SQLite copy of the synced accounts' repos, indexed for browsing.
+
+    sync() walks an account's repos from the most recently updated down and
+    stops at the first one already stored unchanged, so a refresh costs one
+    page of the listing (usually a cached 304) plus the rows that changed.
+    Every FULL_SYNC_INTERVAL a full pass compares every repo, refreshing
+    counts that change without updated_at moving, and drops deleted repos.
+    Reads from many sessions run in parallel on per-thread connections.
+    """
+
+    def __init__(self, path=REPO_STORE_PATH, full_sync_interval=FULL_SYNC_INTERVAL):
+        self.path = path
+        self.full_sync_interval = full_sync_interval
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as db:
+            db.executescript(SCHEMA)
+
+    def _connect(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=10)
+            db.execute("PRAGMA journal_mode=WAL")
+            self._local.db = db
+        return db
+
+    def needs_full_sync(self, account):
+        """
+        Whether the next sync of account must walk every repo: the first sync,
+        and then one every full_sync_interval
+        """
+        state = self._connect().execute("SELECT full_synced_at FROM sync_state WHERE account = ?",
+                                        (account.lower(),)).fetchone()
+        return state is None or state[0] is None or time.time() - state[0] >= self.full_sync_interval
+
+    def sync(self, account, pages, full=None):
+        """
+        Upsert an account's changed repos from pages of records sorted by
+        updated_at, newest first; returns the number of rows that changed.
+
+        An incremental sync stops at the first repo whose updated_at is
+        already stored. A full sync (full=None: when needs_full_sync says so)
+        reads every page, which also refreshes counts such as stars that
+        change without touching updated_at, and removes repos it didn't see.
+        """
+        if full is None:
+            full = self.needs_full_sync(account)
+        account = account.lower()
+        db = self._connect()
+        stored = {row[0]: row for row in db.execute(
+            f"SELECT {', '.join(FIELDS)} FROM repos WHERE account = ?", (account,))}
+
+        changed, seen = [], set()
+        caught_up = False
+        for page in pages:
+            for record in page:
+                row = stored.get(record.id)
+                if not full and row is not None and row[FIELDS.index("updated_at")] == record.updated_at:
+                    # Everything from here on was updated earlier and is already stored
+                    caught_up = True
+                    break
+                seen.add(record.id)
+                if row is None or tuple(_row(account, record)[1:]) != row:
+                    changed.append(record)
+            if caught_up:
+                break
+        removed = set(stored) - seen if full else set()
+
+        now = time.time()
+        with self._write_lock, db:
+            columns = ", ".join(("account",) + FIELDS)
+            db.executemany(f"INSERT OR REPLACE INTO repos ({columns}) VALUES "
+                           f"({', '.join('?' * (len(FIELDS) + 1))})",
+                           [_row(account, record) for record in changed])
+            db.executemany("DELETE FROM repos WHERE id = ?", [(repo_id,) for repo_id in removed])
+            db.execute("INSERT INTO sync_state (account, synced_at, full_synced_at) VALUES (?, ?, ?) "
+                       "ON CONFLICT (account) DO UPDATE SET synced_at = excluded.synced_at, "
+                       "full_synced_at = COALESCE(excluded.full_synced_at, full_synced_at)",
+                       (account, now, now if full else None))
+        if changed or removed:
+            logger.info("Synced %s: %d changed, %d removed%s", account, len(changed), len(removed),
+                        " (full)" if full else "")
+        return len(changed) + len(removed)
+
+    def records(self, account):
+        """
+        All of an account's repos, most starred first
+        """
+        rows = self._connect().execute(
+            f"SELECT {', '.join(FIELDS)} FROM repos WHERE account = ? ORDER BY stars DESC, id",
+            (account.lower(),))
+        return [_record(row) for row in rows]
+
+    def _where(self, accounts, query, language):
+        clauses = [f"account IN ({', '.join('?' * len(accounts))})"]
+        params = [account.lower() for account in accounts]
+        if query:
+            escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append("(name LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\')")
+            params.extend([f"%{escaped}%"] * 2)
+        if language:
+            clauses.append("language = ?")
+            params.append(language)
+        return " AND ".join(clauses), params
+
+    def count(self, accounts, query="", language=None):
+        """
+        Number of repos matching a name/description search and a language
+        """
+        where, params = self._where(accounts, query, language)
+        return self._connect().execute(f"SELECT COUNT(*) FROM repos WHERE {where}", params).fetchone()[0]
+
+    def search(self, accounts, query="", language=None, sort="updated", page=1, per_page=10):
+        """
+        One page of the repos matching a name/description search and a
+        language, in the given SORTS order
+        """
+        where, params = self._where(accounts, query, language)
+        rows = self._connect().execute(
+            f"SELECT {', '.join(FIELDS)} FROM repos WHERE {where} ORDER BY {SORTS[sort]}, id "
+            f"LIMIT ? OFFSET ?", params + [per_page, (page - 1) * per_page])
+        return [_record(row) for row in rows]
+
+    def languages(self, accounts):
+        """
+        Distinct languages of the accounts' repos, for the filter
+        """
+        rows = self._connect().execute(
+            f"SELECT DISTINCT language FROM repos WHERE account IN ({', '.join('?' * len(accounts))}) "
+            "AND language IS NOT NULL ORDER BY language", [account.lower() for account in accounts])
+        return [row[0] for row in rows]
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """
+    Return the process-wide repo store, creating it on first use
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = RepoStore()
+        return _store
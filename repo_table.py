@@ -0,0 +1,59 @@
+import threading
+from operator import attrgetter
+
+import pandas as pd
+
+# (index revision, limit) -> rendered HTML table; only the newest few are kept
+_tables = {}
+_tables_lock = threading.Lock()
+_MAX_TABLES = 8
+
+
+def repo_frame(index):
+    """
+    Build the repo table columns straight from the records, one column at a time
+    """
+    records = index.records
+    return pd.DataFrame({
+        # "owner/name" when the index spans several accounts
+        "Name": index.names(),
+        "Language": list(map(attrgetter("language"), records)),
+        "Stars": list(map(attrgetter("stars"), records)),
+        "Forks": list(map(attrgetter("forks"), records)),
+        # Parsed once here; everything below works on the datetime column
+        "Updated": pd.to_datetime(list(map(attrgetter("updated_at"), records)),
+                                  utc=True, format="ISO8601"),
+        "URL": list(map(attrgetter("url"), records)),
+    })
+
+
+def _render(index, limit):
+    df = repo_frame(index)
+
+    # Most recently updated first; nlargest avoids sorting the whole account
+    df = df.loc[df["Updated"].nlargest(limit).index]
+
+    # GitHub repo names and URLs are limited to URL-safe characters, no escaping needed
+    table = pd.DataFrame({
+        "Name": '<a href="' + df["URL"] + '" target="_blank">' + df["Name"] + "</a>",
+        "Language": df["Language"].fillna("Not specified"),
+        "Stars": df["Stars"],
+        "Forks": df["Forks"],
+        "Last Updated": df["Updated"].dt.strftime("%Y-%m-%d"),
+    })
+    return table.to_html(escape=False, index=False)
+
+
+def recent_repos_html(index, limit=5):
+    """
+    HTML table of the most recently updated repos, memoized per index revision
+    """
+    key = (index.revision, limit)
+    html = _tables.get(key)
+    if html is None:
+        html = _render(index, limit)
+        with _tables_lock:
+            _tables[key] = html
+            while len(_tables) > _MAX_TABLES:
+                del _tables[next(iter(_tables))]
+    return html
@@ -0,0 +1,130 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# Submissions a client can make back to back
+CONTACT_BURST = float(os.getenv("CONTACT_BURST", "3"))
+
+# Seconds for a client to earn one more submission
+CONTACT_REFILL_SECONDS = float(os.getenv("CONTACT_REFILL_SECONDS", "600"))
+
+# Seconds during which the same email, subject and message is only accepted once
+CONTACT_DUPLICATE_WINDOW = float(os.getenv("CONTACT_DUPLICATE_WINDOW", "3600"))
+
+# Reverse proxies in front of the app that append to X-Forwarded-For; the
+# client address is the entry the outermost of them added. 0 ignores the header.
+TRUSTED_PROXY_HOPS = int(os.getenv("TRUSTED_PROXY_HOPS", "1"))
+
+ACCEPTED = "accepted"
+DUPLICATE = "duplicate"
+RATE_LIMITED = "rate_limited"
+
+
+class SubmissionLimiter:
+    """
+    Token-bucket rate limit per client plus duplicate suppression for a form.
+
+    Each client gets a bucket of burst tokens that refills at one token every
+    refill_seconds; a submission spends one. Independently of the client, a
+    submission whose (email, subject, message) was already accepted within the
+    duplicate window is rejected, which covers double clicks and resubmits.
+    Both checks are in-memory and bounded, so rejecting costs no SMTP work.
+    """
+
+    def __init__(self, burst=CONTACT_BURST, refill_seconds=CONTACT_REFILL_SECONDS,
+                 duplicate_window=CONTACT_DUPLICATE_WINDOW, max_clients=10000):
+        self.burst = burst
+        self.refill_seconds = refill_seconds
+        self.duplicate_window = duplicate_window
+        self.max_clients = max_clients
+        # client key -> (tokens, monotonic time they were counted), least recent first
+        self._buckets = OrderedDict()
+        # submission digest -> monotonic time it was accepted, oldest first
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {ACCEPTED: 0, DUPLICATE: 0, RATE_LIMITED: 0}
+
+    def check(self, client, email, subject, message):
+        """
+        Decide on a submission; returns ACCEPTED, DUPLICATE or RATE_LIMITED.
+
+        Only accepted submissions spend a token and are remembered.
+        """
+        digest = hashlib.sha256("\0".join((email.strip().lower(), subject.strip(),
+                                           message.strip())).encode()).digest()
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+
+            if digest in self._seen:
+                return self._reject(DUPLICATE, client)
+
+            tokens, counted_at = self._buckets.pop(client, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - counted_at) / self.refill_seconds)
+            if tokens < 1:
+                self._set_bucket(client, tokens, now)
+                return self._reject(RATE_LIMITED, client)
+
+            self._set_bucket(client, tokens - 1, now)
+            self._seen[digest] = now
+            self._stats[ACCEPTED] += 1
+        metrics.CONTACT_SUBMISSIONS.inc(result=ACCEPTED)
+        return ACCEPTED
+
+    def stats(self):
+        """
+        Return a snapshot of the accepted/rejected counters
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["clients"] = len(self._buckets)
+        return stats
+
+    def _reject(self, reason, client):
+        self._stats[reason] += 1
+        metrics.CONTACT_SUBMISSIONS.inc(result=reason)
+        logger.info("Rejected contact submission from %s (%s); totals %s",
+                    client, reason, self._stats)
+        return reason
+
+    def _set_bucket(self, client, tokens, now):
+        self._buckets[client] = (tokens, now)
+        # Too many clients: forget the least recently seen
+        while len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+
+    def _expire(self, now):
+        while self._seen:
+            digest, accepted_at = next(iter(self._seen.items()))
+            if now - accepted_at < self.duplicate_window:
+                break
+            del self._seen[digest]
+
+        # A bucket that has refilled completely is the same as no bucket
+        full_after = self.burst * self.refill_seconds
+        while self._buckets:
+            client, (tokens, counted_at) = next(iter(self._buckets.items()))
+            if now - counted_at < full_after:
+                break
+            del self._buckets[client]
+
+
+def client_address(forwarded_for, remote_address=None, hops=TRUSTED_PROXY_HOPS):
+    """
+    The visitor's address as seen by the trusted proxies, or None.
+
+    Entries left of the ones our proxies appended are whatever the client
+    sent, so they are never used: a client could pick a new one per request.
+    """
+    if hops > 0 and forwarded_for:
+        hops_seen = [hop.strip() for hop in forwarded_for.split(",")]
+        if len(hops_seen) >= hops and hops_seen[-hops]:
+            return hops_seen[-hops]
+    return remote_address or None
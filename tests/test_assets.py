@@ -0,0 +1,29 @@
+import assets
+
+
+def test_minify_css():
+    css = """
+    /* comment */
+    a :hover , p > b {
+        color: red;
+        margin: 0 auto;
+    }
+    """
+    assert assets.minify_css(css) == "a :hover,p>b{color:red;margin:0 auto}"
+
+
+def test_stylesheet_is_inlined():
+    tag = assets.stylesheet_tag()
+    assert tag.startswith("<style>") and tag.endswith("</style>")
+    assert assets.minified_stylesheet() in tag
+
+
+def test_asset_url(tmp_path, monkeypatch):
+    monkeypatch.setattr(assets, "STATIC_DIR", str(tmp_path))
+    (tmp_path / "photo.png").write_bytes(b"\x89PNG")
+    (tmp_path / "logo.svg").write_text("<svg/>" * 2000)
+
+    # Streamlit serves PNGs; SVGs of any size would go out as text/plain
+    assert assets.asset_url("photo.png").startswith("app/static/photo.png?v=")
+    assert assets.asset_url("logo.svg").startswith("data:image/svg+xml;base64,")
+    assert assets.asset_url("https://example.com/a.svg") == "https://example.com/a.svg"
@@ -0,0 +1,151 @@
+import json
+
+import pytest
+
+import metrics
+from benchmarks.stubs import GitHubStub
+from github_client import PER_PAGE, GitHubClient, RateLimitExceeded
+
+
+def repos(count):
+    return [{"id": i, "name": f"repo-{i}", "updated_at": f"2024-01-01T00:00:{i % 60:02d}Z"}
+            for i in range(count)]
+
+
+@pytest.fixture
+def github(tmp_path):
+    path = tmp_path / "github.json"
+    path.write_text(json.dumps({"users/someone/repos": repos(250), "users/someone": {"login": "someone"}}))
+    stub = GitHubStub(str(path)).start()
+    yield stub
+    stub.stop()
+
+
+def client_for(stub, **kwargs):
+    kwargs.setdefault("backoff_factor", 0)
+    return GitHubClient(base_url=stub.url, **kwargs)
+
+
+def expire(client):
+    for entry in client._cache.values():
+        entry["fetched_at"] = float("-inf")
+
+
+def test_fresh_entry_skips_the_network(github):
+    client = client_for(github)
+    first, _ = client.get("/users/someone")
+    second, _ = client.get("/users/someone")
+    assert second is first
+    assert github.requests == 1
+    assert client.cache_stats()["hits"] == 1
+
+
+def test_expired_entry_is_revalidated(github):
+    client = client_for(github)
+    payload, _ = client.get("/users/someone")
+    expire(client)
+    again, _ = client.get("/users/someone")
+
+    _, _, headers = github.log[-1]
+    assert headers["If-None-Match"] == client.validators("/users/someone")[0]
+    # The 304 keeps the very same cached payload
+    assert again is payload
+    assert client.cache_stats()["revalidations"] == 1
+
+
+def test_stale_entry_served_when_rate_limit_is_low(github):
+    client = client_for(github, rate_limit_floor=10)
+    payload, _ = client.get("/users/someone")
+    github.rate_limit["core"] = 10
+    expire(client)
+    client.get("/users/someone")  # Revalidates and learns the budget is spent
+    requests = github.requests
+    expire(client)
+
+    assert client.get("/users/someone")[0] is payload
+    assert github.requests == requests
+    assert client.cache_stats()["stale"] == 1
+
+
+def test_rate_limit_exceeded_without_cache(github):
+    client = client_for(github, rate_limit_floor=10)
+    github.rate_limit["core"] = 5
+    client.get("/users/someone")
+    with pytest.raises(RateLimitExceeded):
+        client.get("/users/someone/repos")
+
+
+def test_server_errors_are_retried(github):
+    client = client_for(github, retries=3)
+    github.failures = [502, 503]
+    payload, _ = client.get("/users/someone")
+    assert payload == {"login": "someone"}
+    assert github.requests == 3
+
+
+def test_server_errors_raise_once_retries_are_spent(github):
+    client = client_for(github, retries=1)
+    github.failures = [503, 503]
+    with pytest.raises(Exception):
+        client.get("/users/someone")
+
+
+def test_fetch_pages_in_order(github):
+    client = client_for(github)
+    pages = client.fetch_pages("/users/someone/repos")
+    assert [len(page) for page in pages] == [PER_PAGE, PER_PAGE, 50]
+    assert [repo["id"] for page in pages for repo in page] == list(range(250))
+
+
+def test_fetch_pages_past_a_stale_link_header(github):
+    client = client_for(github)
+    github.fixtures["users/someone/repos"] = repos(150)
+    assert [len(page) for page in client.fetch_pages("/users/someone/repos")] == [PER_PAGE, 50]
+
+    # The account grows; the cached first page still says there are two pages
+    github.fixtures["users/someone/repos"] = repos(250)
+    for url, entry in client._cache.items():
+        if not url.endswith("page=1"):
+            entry["fetched_at"] = float("-inf")
+    pages = client.fetch_pages("/users/someone/repos")
+    assert [len(page) for page in pages] == [PER_PAGE, PER_PAGE, 50]
+
+
+def test_fetch_pages_with_query(github):
+    client = client_for(github)
+    client.fetch_pages("/users/someone/repos", "sort=updated&direction=desc")
+    _, path, _ = github.log[0]
+    assert path == f"/users/someone/repos?sort=updated&direction=desc&per_page={PER_PAGE}&page=1"
+
+
+def test_rate_limits_are_tracked_per_resource(github):
+    client = client_for(github, token="stub-token", rate_limit_floor=10)
+    github.fixtures["users/someone/repos"] = []
+    github.rate_limit["graphql"] = 0
+    query = "query($login: String!) { repositoryOwner(login: $login) { login } }"
+    client.graphql(query, {"login": "someone", "first": 1})
+
+    # An exhausted GraphQL budget doesn't block REST calls
+    assert client.get("/users/someone")[0] == {"login": "someone"}
+    with pytest.raises(RateLimitExceeded, match="graphql"):
+        client.graphql(query, {"login": "someone", "first": 1})
+
+    # and REST calls don't overwrite the GraphQL budget
+    assert client.cache_stats()["rate_limits"]["graphql"]["remaining"] == 0
+    assert client.cache_stats()["rate_limits"]["core"]["remaining"] == 4999
+
+
+def test_cache_lookups_are_exported(github):
+    def lookups():
+        return dict(metrics.GITHUB_CACHE_LOOKUPS.samples())
+
+    before = lookups()
+    client = client_for(github)
+    client.get("/users/someone")
+    client.get("/users/someone")
+    expire(client)
+    client.get("/users/someone")
+    after = lookups()
+    assert {result: after[(result,)] - before.get((result,), 0)
+            for result in ("misses", "hits", "revalidations")} == {
+        "misses": 1, "hits": 1, "revalidations": 1}
@@ -0,0 +1,66 @@
+import pytest
+
+import github_graphql
+from benchmarks.stubs import GitHubStub
+from github_client import GitHubClient, GraphQLError
+from github_graphql import iter_repo_pages
+from repo_records import records_from_github
+
+
+@pytest.fixture(scope="module")
+def github():
+    stub = GitHubStub().start()
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def client(github):
+    return GitHubClient(base_url=github.url, token="stub-token", backoff_factor=0)
+
+
+def graphql_records(client, **kwargs):
+    return [record for page in iter_repo_pages("jadontelep", client=client, **kwargs) for record in page]
+
+
+def test_rest_and_graphql_agree(client):
+    rest = {record.id: record for record in client.get("/users/jadontelep/repos?per_page=100",
+                                                       transform=records_from_github)[0]}
+    graphql = {record.id: record for record in graphql_records(client)}
+
+    assert graphql.keys() == rest.keys()
+    for repo_id, record in graphql.items():
+        expected = rest[repo_id]
+        assert (record.name, record.stars, record.watchers, record.open_issues, record.forks) == (
+            expected.name, expected.stars, expected.watchers, expected.open_issues, expected.forks)
+        assert record.full_name == expected.full_name
+
+
+def test_cursor_pagination(client, github, monkeypatch):
+    everything = graphql_records(client)
+    monkeypatch.setattr(github_graphql, "PER_PAGE", 5)
+    requests = github.requests
+    pages = list(iter_repo_pages("jadontelep", order_by="STARGAZERS", client=client))
+
+    assert [len(page) for page in pages[:-1]] == [5] * (len(pages) - 1)
+    assert len(pages) == github.requests - requests == -(-len(everything) // 5)
+    records = [record for page in pages for record in page]
+    assert sorted(record.id for record in records) == sorted(record.id for record in everything)
+    assert [record.stars for record in records] == sorted((r.stars for r in records), reverse=True)
+
+
+def test_pages_are_requested_lazily(client, github, monkeypatch):
+    monkeypatch.setattr(github_graphql, "PER_PAGE", 5)
+    requests = github.requests
+    next(iter_repo_pages("jadontelep", client=client))
+    assert github.requests - requests == 1
+
+
+def test_updated_at_order(client):
+    records = graphql_records(client, order_by="UPDATED_AT")
+    assert [r.updated_at for r in records] == sorted((r.updated_at for r in records), reverse=True)
+
+
+def test_missing_account(client):
+    with pytest.raises(GraphQLError, match="not found"):
+        next(iter_repo_pages("no-such-account", client=client))
@@ -0,0 +1,114 @@
+import os
+import smtplib
+import time
+from email.message import EmailMessage
+
+import pytest
+
+import mail_queue
+from mail_queue import MailQueue
+
+
+class FakeSMTP:
+    """
+    Stands in for smtplib.SMTP; login_error and send_errors script its replies
+    """
+    login_error = None
+    send_errors = []
+    sent = []
+
+    def __init__(self, host, port, timeout=None):
+        pass
+
+    def starttls(self):
+        pass
+
+    def login(self, username, password):
+        if FakeSMTP.login_error is not None:
+            raise FakeSMTP.login_error
+
+    def send_message(self, msg):
+        if FakeSMTP.send_errors:
+            raise FakeSMTP.send_errors.pop(0)
+        FakeSMTP.sent.append(msg["Subject"])
+
+    def quit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def smtp(monkeypatch):
+    monkeypatch.setattr(mail_queue.smtplib, "SMTP", FakeSMTP)
+    FakeSMTP.login_error = None
+    FakeSMTP.send_errors = []
+    FakeSMTP.sent = []
+    return FakeSMTP
+
+
+def message(subject):
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    msg["From"] = "visitor@example.com"
+    msg["To"] = "owner@example.com"
+    msg.set_content("Hello")
+    return msg
+
+
+def spooled(queue):
+    return sorted(name for name in os.listdir(queue.spool_dir) if name.endswith(".eml"))
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_login_failure_keeps_messages_spooled(smtp, tmp_path):
+    smtp.login_error = smtplib.SMTPAuthenticationError(535, b"Username and Password not accepted")
+    queue = MailQueue("user", "password", spool_dir=str(tmp_path), backoff=0.01, max_retries=2)
+    for subject in ("a", "b", "c"):
+        queue.enqueue(message(subject))
+    queue.start()
+    wait_for(lambda: queue.stats()["retries"] >= 5)
+
+    assert len(spooled(queue)) == 3
+    assert os.listdir(queue.failed_dir) == []
+
+    # Once the login works again everything is delivered
+    smtp.login_error = None
+    wait_for(lambda: queue.stats()["sent"] == 3)
+    queue.stop(timeout=5)
+    assert smtp.sent == ["a", "b", "c"]
+    assert spooled(queue) == []
+
+
+def test_rejected_message_fails_alone(smtp, tmp_path):
+    smtp.send_errors = [smtplib.SMTPResponseException(550, b"Mailbox unavailable")]
+    queue = MailQueue("user", "password", spool_dir=str(tmp_path), backoff=0.01)
+    for subject in ("a", "b"):
+        queue.enqueue(message(subject))
+    queue.start()
+    wait_for(lambda: queue.stats()["sent"] == 1)
+    queue.stop(timeout=5)
+
+    assert smtp.sent == ["b"]
+    assert len(os.listdir(queue.failed_dir)) == 1
+    assert spooled(queue) == []
+
+
+def test_transient_errors_are_retried(smtp, tmp_path):
+    smtp.send_errors = [smtplib.SMTPServerDisconnected("Connection unexpectedly closed")]
+    queue = MailQueue("user", "password", spool_dir=str(tmp_path), backoff=0.01)
+    queue.enqueue(message("a"))
+    queue.start()
+    wait_for(lambda: queue.stats()["sent"] == 1)
+    queue.stop(timeout=5)
+
+    assert smtp.sent == ["a"]
+    assert queue.stats()["retries"] == 1
+    assert os.listdir(queue.failed_dir) == []
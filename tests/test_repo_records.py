@@ -0,0 +1,36 @@
+from repo_records import RepoIndex, RepoRecord, merge_indexes
+
+
+def repo(repo_id, name, stars, owner="someone"):
+    return RepoRecord.from_dict({"id": repo_id, "name": name, "stars": stars,
+                                 "url": f"https://github.com/{owner}/{name}"})
+
+
+def test_neighbours():
+    index = RepoIndex([repo(i, f"repo-{i}", stars=i) for i in range(6)])
+    assert [record.name for record in index.neighbours("repo-3")] == ["repo-2", "repo-4"]
+    assert [record.name for record in index.neighbours("repo-3", distance=2)] == [
+        "repo-2", "repo-4", "repo-1", "repo-5"]
+    # Ends of the list
+    assert [record.name for record in index.neighbours("repo-5")] == ["repo-4"]
+    assert [record.name for record in index.neighbours("repo-0")] == ["repo-1"]
+    assert index.neighbours("missing") == []
+
+
+def test_merge_indexes():
+    mine = RepoIndex([repo(1, "a", 10), repo(2, "b", 3), repo(3, "shared", 1)])
+    org = RepoIndex([repo(4, "a", 7, owner="org"), repo(3, "shared", 1), repo(5, "c", 0, owner="org")])
+    merged = merge_indexes([mine, org])
+
+    # Star order across both accounts; repo 3 appears in both and is kept once
+    assert [record.id for record in merged] == [1, 4, 2, 3, 5]
+    assert merged.qualified
+    assert merged.names() == ["someone/a", "org/a", "someone/b", "someone/shared", "org/c"]
+    assert merged.get("org/a").stars == 7
+    assert merged.get("a") is None
+
+
+def test_single_owner_names_are_not_qualified():
+    index = merge_indexes([RepoIndex([repo(1, "a", 1)]), RepoIndex([repo(2, "b", 2)])])
+    assert not index.qualified
+    assert index.names() == ["b", "a"]
@@ -0,0 +1,75 @@
+import pytest
+
+from repo_records import RepoRecord
+from repo_store import RepoStore
+
+
+def repo(repo_id, name, updated_at, stars=0, language="Python", **fields):
+    return RepoRecord.from_dict(dict(
+        fields, id=repo_id, name=name, updated_at=updated_at, stars=stars, language=language,
+        created_at="2023-01-01T00:00:00Z", url=f"https://github.com/someone/{name}"))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return RepoStore(str(tmp_path / "repos.sqlite3"), full_sync_interval=3600)
+
+
+def pages_of(records, per_page=2):
+    """
+    Pages sorted newest first, recording how many were consumed
+    """
+    records = sorted(records, key=lambda record: record.updated_at, reverse=True)
+    pages_of.consumed = 0
+    for start in range(0, len(records), per_page):
+        pages_of.consumed += 1
+        yield records[start:start + per_page]
+
+
+REPOS = [repo(i, f"repo-{i}", f"2024-01-{i:02d}T00:00:00Z", stars=i) for i in range(1, 8)]
+
+
+def test_first_sync_is_full(store):
+    assert store.needs_full_sync("someone")
+    assert store.sync("Someone", pages_of(REPOS)) == 7
+    assert not store.needs_full_sync("someone")
+    assert [record.name for record in store.records("someone")][:2] == ["repo-7", "repo-6"]
+
+
+def test_incremental_sync_stops_at_first_unchanged_repo(store):
+    store.sync("someone", pages_of(REPOS))
+    updated = [repo(3, "repo-3", "2024-02-01T00:00:00Z", stars=30)] + [r for r in REPOS if r.id != 3]
+    assert store.sync("someone", pages_of(updated)) == 1
+    # repo-3 and repo-7 fill the first page; the walk stops at repo-7
+    assert pages_of.consumed == 1
+    assert store.search(["someone"], sort="updated", per_page=1)[0].stars == 30
+
+
+def test_full_sync_refreshes_counts_and_removes_deleted_repos(store):
+    store.sync("someone", pages_of(REPOS))
+    # Stars and the last commit move without updated_at; repo-7 was deleted
+    current = [repo(1, "repo-1", REPOS[0].updated_at, stars=50,
+                    last_commit_at="2024-03-01T00:00:00Z")] + REPOS[1:6]
+    assert store.sync("someone", pages_of(current), full=False) == 0
+    assert store.sync("someone", pages_of(current), full=True) == 2
+    records = {record.id: record for record in store.records("someone")}
+    assert 7 not in records
+    assert records[1].stars == 50
+    assert records[1].last_commit_at == "2024-03-01T00:00:00Z"
+    # Nothing left to change
+    assert store.sync("someone", pages_of(current), full=True) == 0
+
+
+def test_search_filter_and_pagination(store):
+    store.sync("someone", pages_of(REPOS + [
+        repo(8, "ml_notes", "2024-01-08T00:00:00Z", language="R", description="100% notebooks"),
+    ]))
+    assert store.count(["someone"]) == 8
+    assert store.count(["someone"], language="R") == 1
+    assert store.count(["someone"], query="100%") == 1
+    # LIKE wildcards in the query are matched literally
+    assert store.count(["someone"], query="_") == 1
+    assert [r.name for r in store.search(["someone"], sort="stars", page=2, per_page=3)] == [
+        "repo-4", "repo-3", "repo-2"]
+    assert store.languages(["someone"]) == ["Python", "R"]
+    assert store.count(["someone-else"]) == 0
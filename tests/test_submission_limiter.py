@@ -0,0 +1,100 @@
+import pytest
+
+import submission_limiter
+from submission_limiter import (ACCEPTED, DUPLICATE, RATE_LIMITED, SubmissionLimiter,
+                                client_address)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(submission_limiter.time, "monotonic", lambda: now[0])
+    return now
+
+
+def submit(limiter, client, n):
+    return limiter.check(client, "visitor@example.com", "Hello", f"Message {n}")
+
+
+def test_burst_then_rate_limited(clock):
+    limiter = SubmissionLimiter(burst=3, refill_seconds=600)
+    assert [submit(limiter, "a", n) for n in range(4)] == [ACCEPTED] * 3 + [RATE_LIMITED]
+    # Other clients have their own bucket
+    assert submit(limiter, "b", 4) == ACCEPTED
+
+
+def test_refill(clock):
+    limiter = SubmissionLimiter(burst=2, refill_seconds=600)
+    submit(limiter, "a", 0)
+    submit(limiter, "a", 1)
+    clock[0] += 599
+    assert submit(limiter, "a", 2) == RATE_LIMITED
+    clock[0] += 1
+    assert submit(limiter, "a", 3) == ACCEPTED
+    assert submit(limiter, "a", 4) == RATE_LIMITED
+
+
+def test_refill_is_capped_at_burst(clock):
+    limiter = SubmissionLimiter(burst=2, refill_seconds=10)
+    clock[0] += 10000
+    assert [submit(limiter, "a", n) for n in range(3)] == [ACCEPTED, ACCEPTED, RATE_LIMITED]
+
+
+def test_duplicate_window(clock):
+    limiter = SubmissionLimiter(burst=10, refill_seconds=1, duplicate_window=3600)
+    assert limiter.check("a", "Visitor@Example.com", "Hi", "Same") == ACCEPTED
+    # Any client, case and surrounding whitespace don't matter
+    assert limiter.check("b", " visitor@example.com", "Hi ", "Same\n") == DUPLICATE
+    clock[0] += 3600
+    assert limiter.check("b", "visitor@example.com", "Hi", "Same") == ACCEPTED
+
+
+def test_rejections_spend_no_token(clock):
+    limiter = SubmissionLimiter(burst=1, refill_seconds=600)
+    limiter.check("a", "visitor@example.com", "Hi", "Same")
+    clock[0] += 600
+    assert limiter.check("a", "visitor@example.com", "Hi", "Same") == DUPLICATE
+    assert submit(limiter, "a", 1) == ACCEPTED
+
+
+def test_full_buckets_are_dropped(clock):
+    limiter = SubmissionLimiter(burst=2, refill_seconds=10)
+    submit(limiter, "a", 0)
+    assert limiter.stats()["clients"] == 1
+    clock[0] += 20
+    submit(limiter, "b", 1)
+    assert limiter.stats()["clients"] == 1
+
+
+def test_least_recent_client_is_evicted(clock):
+    limiter = SubmissionLimiter(burst=1, refill_seconds=600, max_clients=2)
+    for n, client in enumerate(("a", "b", "c")):
+        submit(limiter, client, n)
+    assert limiter.stats()["clients"] == 2
+    # "a" was evicted and starts over with a full bucket; "c" is still limited
+    assert submit(limiter, "a", 3) == ACCEPTED
+    assert submit(limiter, "c", 4) == RATE_LIMITED
+
+
+def test_stats(clock):
+    limiter = SubmissionLimiter(burst=1, refill_seconds=600)
+    limiter.check("a", "visitor@example.com", "Hi", "Same")
+    limiter.check("b", "visitor@example.com", "Hi", "Same")
+    submit(limiter, "a", 1)
+    assert limiter.stats() == {ACCEPTED: 1, DUPLICATE: 1, RATE_LIMITED: 1, "clients": 1}
+
+
+@pytest.mark.parametrize("forwarded_for, remote, hops, expected", [
+    # The entry the proxy appended, whatever the client put before it
+    ("6.6.6.6, 203.0.113.7", "10.0.0.1", 1, "203.0.113.7"),
+    ("203.0.113.7", "10.0.0.1", 1, "203.0.113.7"),
+    ("6.6.6.6, 203.0.113.7, 10.0.0.2", "10.0.0.1", 2, "203.0.113.7"),
+    # Too few hops or no header: the connection's address
+    ("203.0.113.7", "10.0.0.1", 2, "10.0.0.1"),
+    (None, "10.0.0.1", 1, "10.0.0.1"),
+    # Header not trusted
+    ("203.0.113.7", "10.0.0.1", 0, "10.0.0.1"),
+    (None, None, 1, None),
+])
+def test_client_address(forwarded_for, remote, hops, expected):
+    assert client_address(forwarded_for, remote, hops) == expected
@@ -0,0 +1,35 @@
+import threading
+
+import requests
+
+from utils import fetch_repo_indexes
+
+
+def test_failing_account_does_not_stop_the_others():
+    error = requests.exceptions.HTTPError("404 Not Found")
+
+    def fetch(username):
+        if username == "ghost":
+            raise error
+        return f"index of {username}"
+
+    results = fetch_repo_indexes(["someone", "ghost", "org"], fetch=fetch, workers=2)
+    assert list(results) == ["someone", "ghost", "org"]
+    assert results["someone"] == "index of someone"
+    assert results["ghost"] is error
+    assert results["org"] == "index of org"
+
+
+def test_accounts_are_fetched_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fetch(username):
+        # Only returns once all three accounts are being fetched at the same time
+        barrier.wait()
+        return username
+
+    assert fetch_repo_indexes(["a", "b", "c"], fetch=fetch, workers=3) == {"a": "a", "b": "b", "c": "c"}
+
+
+def test_single_account():
+    assert fetch_repo_indexes(["someone"], fetch=str.upper) == {"someone": "SOMEONE"}
@@ -1,30 +1,86 @@
-import requests
 import os
-import streamlit as st
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import metrics
+from github_client import get_client
+from github_graphql import iter_repo_pages
+from repo_records import RepoIndex, records_from_github
+from repo_store import get_store
 
-def get_github_repos(username):
+# Users and organizations whose repos the GitHub page shows, comma separated
+GITHUB_ACCOUNTS = [account.strip() for account in os.getenv("GITHUB_ACCOUNTS", "jadontelep").split(",")
+                   if account.strip()]
+
+# Accounts fetched at the same time
+ACCOUNT_WORKERS = int(os.getenv("GITHUB_ACCOUNT_WORKERS", "4"))
+
+# "rest" or "graphql". GraphQL also fetches languages, topics and the last
+# commit, but needs a GITHUB_TOKEN; without one REST is used.
+GITHUB_BACKEND = os.getenv("GITHUB_BACKEND", "rest").lower()
+
+# username -> index built from the store at its last change
+_indexes = {}
+_index_lock = threading.Lock()
+
+
+def use_graphql():
+    return GITHUB_BACKEND == "graphql" and get_client().authenticated
+
+
+def fetch_repo_index(username):
     """
-    Fetch GitHub repositories for a specific user
+    Sync a user's GitHub repositories into the repo store and return them as
+    a shared RepoIndex, the same object for as long as nothing changes.
+
+    Raises requests.exceptions.RequestException when GitHub can't be reached.
     """
-    url = f"https://api.github.com/users/{username}/repos"
-    
-    # Check if a GitHub token is available in environment variables
-    github_token = os.getenv("GITHUB_TOKEN", "")
-    
-    if github_token:
-        headers = {"Authorization": f"token {github_token}"}
-    else:
-        headers = {}
-    
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()  # Raise an exception for HTTP errors
-        
-        repos = response.json()
-        # Sort repos by stars in descending order
-        repos.sort(key=lambda x: x.get("stargazers_count", 0), reverse=True)
-        
-        return repos
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching GitHub repositories: {str(e)}")
-        return []
\ No newline at end of file
+        with metrics.GITHUB_FETCH_SECONDS.time(account=username):
+            store = get_store()
+            full = store.needs_full_sync(username)
+            changed = store.sync(username, _updated_pages(username, full), full=full)
+            with _index_lock:
+                index = _indexes.get(username)
+                if index is None or changed:
+                    index = RepoIndex(store.records(username), presorted=True)
+                    _indexes[username] = index
+                return index
+    except Exception as e:
+        metrics.GITHUB_FETCH_ERRORS.inc(account=username, error=type(e).__name__)
+        raise
+
+
+def _updated_pages(username, full):
+    """
+    Pages of a user's repos, most recently updated first. A full sync reads
+    them all, concurrently over REST; an incremental one requests each page
+    only when the sync gets to it.
+    """
+    if use_graphql():
+        # Cursor pagination: each page needs the previous one's cursor
+        return iter_repo_pages(username, order_by="UPDATED_AT")
+    client = get_client()
+    path, query = f"/users/{username}/repos", "sort=updated&direction=desc"
+    if full:
+        return client.fetch_pages(path, query, transform=records_from_github)
+    return client.iter_pages(path, query, transform=records_from_github)
+
+
+def fetch_repo_indexes(usernames, fetch=fetch_repo_index, workers=ACCOUNT_WORKERS):
+    """
+    Fetch several accounts concurrently, at most workers at a time.
+
+    Returns {username: RepoIndex or the exception that account raised}, so one
+    failing account doesn't stop the others.
+    """
+    def fetch_one(username):
+        try:
+            return fetch(username)
+        except Exception as e:  # Only this account is affected
+            return e
+
+    if len(usernames) == 1:
+        return {usernames[0]: fetch_one(usernames[0])}
+    with ThreadPoolExecutor(max_workers=min(workers, len(usernames)),
+                            thread_name_prefix="github-accounts") as pool:
+        return dict(zip(usernames, pool.map(fetch_one, usernames)))
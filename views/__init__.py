@@ -0,0 +1,64 @@
+"""
+One module per page, each with a render() function.
+
+Page modules are imported the first time a visitor opens that page, so heavy
+dependencies (the repo store and README cache for GitHub) never slow down
+startup or the first paint of the Home page. Contact is the exception: app.py
+loads it at startup to resume delivering spooled mail.
+"""
+import functools
+import importlib
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+import metrics
+
+# Navigation label -> page module, in sidebar order
+PAGES = {
+    "Home": "views.home",
+    "Projects": "views.projects",
+    "GitHub": "views.github",
+    "Contact": "views.contact",
+}
+
+# st.fragment arrived in Streamlit 1.37 (experimental_fragment in 1.33)
+_st_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+
+def load(page):
+    """
+    Import (once) and return the module rendering a page
+    """
+    return importlib.import_module(PAGES[page])
+
+
+def _is_fragment_rerun():
+    ctx = get_script_run_ctx()
+    return bool(getattr(ctx, "fragment_ids_this_run", None))
+
+
+def fragment(name):
+    """
+    Render the decorated function as a Streamlit fragment: its widgets rerun
+    only the function, not app.py with the styles, sidebar and navigation.
+
+    Fragment-only reruns are timed in RERUN_SECONDS under page=name. Without
+    fragment support the function is called as part of the full rerun.
+    """
+    def decorate(func):
+        if _st_fragment is None:
+            return func
+
+        @functools.wraps(func)
+        def run(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if _is_fragment_rerun():
+                    metrics.RERUN_SECONDS.observe(time.perf_counter() - started, page=name)
+
+        return _st_fragment(run)
+    return decorate
@@ -0,0 +1,114 @@
+import logging
+import re
+from email.message import EmailMessage
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+import content
+import metrics
+import views
+from mail_queue import MailQueue
+from submission_limiter import ACCEPTED, DUPLICATE, SubmissionLimiter, client_address
+
+logger = logging.getLogger(__name__)
+
+
+@st.cache_resource
+def get_mail_queue():
+    # One delivery worker and SMTP connection shared by every session
+    mail_queue = MailQueue(
+        username='jadon.telep@gmail.com',
+        password=st.secrets["api_keys"]["TOKEN"],  # Use an app password if using Gmail
+    ).start()
+    metrics.MAIL_QUEUE_PENDING.set_function(mail_queue.pending)
+    return mail_queue
+
+
+def start_mail_queue():
+    """
+    Start delivering at app startup, so messages spooled before a restart go
+    out without waiting for a new submission
+    """
+    try:
+        get_mail_queue()
+    except (KeyError, FileNotFoundError) as e:
+        # No SMTP credentials configured; the form reports it when used
+        logger.warning("Mail delivery not started: %s", e)
+
+
+@st.cache_resource
+def get_submission_limiter():
+    # Limits and duplicates are tracked across every session
+    return SubmissionLimiter()
+
+
+def client_key():
+    """
+    Identify the visitor for rate limiting: their address when the server
+    can see it, otherwise their browser session
+    """
+    context = getattr(st, "context", None)
+    if context is not None:
+        address = getattr(context, "ip_address", None)
+        address = client_address(context.headers.get("X-Forwarded-For"),
+                                 address if isinstance(address, str) else None)
+        if address:
+            return address
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else "unknown"
+
+
+def is_valid_email(email):
+    pattern = r'^[\w\.-]+@[\w\.-]+\.\w+$'
+    return re.match(pattern, email) is not None
+
+
+@views.fragment("Contact/form")
+def contact_form():
+    """
+    The form; submitting it reruns only this fragment
+    """
+    # Contact form with animation delay
+    with st.form("contact_form"):
+        email = st.text_input("Email")
+        subject = st.text_input("Subject")
+        message = st.text_area("Message", height=150)
+
+        submitted = st.form_submit_button("Send Message")
+
+        if submitted:
+            if subject and email and message:
+                if not is_valid_email(email):
+                    st.error("Invalid email")
+                else:
+                    # Throttle before any mail work is done
+                    verdict = get_submission_limiter().check(client_key(), email, subject, message)
+                    if verdict == ACCEPTED:
+                        msg = EmailMessage()
+                        msg['Subject'] = subject
+                        msg['From'] = email
+                        msg['To'] = 'jadon.telep@gmail.com'
+                        msg.set_content(message)
+
+                        # Hand off to the background sender so the rerun returns right away
+                        get_mail_queue().enqueue(msg)
+
+                        st.success("Thank you for reaching out! Your message has been queued and I'll get back to you as soon as possible.")
+                    elif verdict == DUPLICATE:
+                        st.info("This message has already been sent, no need to send it again.")
+                    else:
+                        st.error("Too many messages sent in a short time. Please try again later.")
+            else:
+                st.error("Please fill in all required fields.")
+
+
+def render():
+    st.title("Contact Me")
+
+    st.markdown(content.render("contact"), unsafe_allow_html=True)
+
+    contact_form()
+
+    # Availability section with card styling
+    st.markdown(content.render("availability"), unsafe_allow_html=True)
@@ -0,0 +1,180 @@
+import html
+
+import requests
+import streamlit as st
+
+import profiling
+import views
+from repo_readme import ReadmeCache
+from repo_refresher import RepoRefresher
+from repo_store import SORTS, get_store
+from utils import GITHUB_ACCOUNTS
+
+# Rows per page of the repository browser
+PAGE_SIZE = 10
+
+SORT_LABELS = {"updated": "Recently updated", "stars": "Most stars", "name": "Name"}
+
+
+@st.cache_resource
+def get_repo_refresher(usernames):
+    # Warm the repo list once per process and keep refreshing it in the background
+    return RepoRefresher(usernames).start()
+
+
+@st.cache_resource
+def get_readme_cache():
+    # Rendered READMEs are shared by every session
+    return ReadmeCache()
+
+
+def show_readme(repos, name):
+    repo = repos.get(name)
+    readmes = get_readme_cache()
+    # Visitors tend to step through the list, so warm the repos around this one
+    readmes.prefetch([neighbour.full_name for neighbour in repos.neighbours(name)])
+
+    st.markdown("**README**")
+    try:
+        html = readmes.get(repo.full_name)
+    except requests.exceptions.RequestException as e:
+        st.warning(f"Could not load the README: {str(e)}")
+        return
+    if html is None:
+        st.caption("This repository has no README")
+    else:
+        st.markdown(f'<div class="readme-preview">{html}</div>', unsafe_allow_html=True)
+
+
+def results_html(records, qualified):
+    """
+    HTML table of one page of search results
+    """
+    rows = []
+    for record in records:
+        name = record.full_name if qualified else record.name
+        rows.append(
+            "<tr>"
+            f'<td><a href="{html.escape(record.url)}" target="_blank">{html.escape(name)}</a></td>'
+            f"<td>{html.escape(record.language or 'Not specified')}</td>"
+            f"<td>{record.stars}</td>"
+            f"<td>{record.forks}</td>"
+            f"<td>{record.updated_at.split('T')[0]}</td>"
+            "</tr>")
+    return ('<table class="dataframe"><thead><tr><th>Name</th><th>Language</th><th>Stars</th>'
+            f"<th>Forks</th><th>Last Updated</th></tr></thead><tbody>{''.join(rows)}</tbody></table>")
+
+
+@views.fragment("GitHub/repositories")
+def show_browser(refresher):
+    """
+    Search, filter and page through the synced repos; every rerun is a few
+    indexed queries against the repo store
+    """
+    repos = refresher.snapshot()
+    qualified = repos.qualified if repos else False
+    store = get_store()
+    search_col, language_col, sort_col = st.columns([2, 1, 1])
+    with search_col:
+        query = st.text_input("Search", placeholder="Name or description")
+    with language_col:
+        language = st.selectbox("Language", ["All"] + store.languages(GITHUB_ACCOUNTS))
+    with sort_col:
+        sort = st.selectbox("Sort by", list(SORTS), format_func=SORT_LABELS.get)
+
+    language = None if language == "All" else language
+    total = store.count(GITHUB_ACCOUNTS, query, language)
+    if not total:
+        st.caption("No repositories match")
+        return
+
+    pages = -(-total // PAGE_SIZE)
+    page = st.number_input("Page", min_value=1, max_value=pages, value=1) if pages > 1 else 1
+    records = store.search(GITHUB_ACCOUNTS, query, language, sort, page, PAGE_SIZE)
+    first = (page - 1) * PAGE_SIZE + 1
+    st.caption(f"Showing {first}–{first + len(records) - 1} of {total}")
+    st.write(results_html(records, qualified), unsafe_allow_html=True)
+
+
+@views.fragment("GitHub/details")
+def show_details(refresher):
+    """
+    Repo picker with the selected repo's details and README
+    """
+    repos = refresher.snapshot()
+    if not repos:
+        return
+
+    # Create selectable repo list
+    selected_repo = st.selectbox("Select a repository to view details", repos.names())
+
+    # Find the selected repo
+    selected_repo_data = repos.get(selected_repo)
+
+    if selected_repo_data:
+        st.subheader(selected_repo_data.name)
+
+        col1, col2 = st.columns([3, 1])
+
+        with col1:
+            st.markdown(f"**Description**: {selected_repo_data.description or 'No description available'}")
+            st.markdown(f"**Language**: {selected_repo_data.language or 'Not specified'}")
+            st.markdown(f"**Created**: {selected_repo_data.created_at.split('T')[0]}")
+            st.markdown(f"**Last Updated**: {selected_repo_data.updated_at.split('T')[0]}")
+            if selected_repo_data.last_commit_at:
+                st.markdown(f"**Last Commit**: {selected_repo_data.last_commit_at.split('T')[0]}")
+            if selected_repo_data.languages:
+                total = sum(selected_repo_data.languages.values()) or 1
+                breakdown = ", ".join(f"{name} {size / total:.0%}"
+                                      for name, size in selected_repo_data.languages.items())
+                st.markdown(f"**Languages**: {breakdown}")
+            if selected_repo_data.topics:
+                st.markdown(f"**Topics**: {', '.join(selected_repo_data.topics)}")
+            st.markdown(f"**URL**: [{selected_repo_data.url}]({selected_repo_data.url})")
+
+        with col2:
+            st.metric("Stars", selected_repo_data.stars)
+            st.metric("Forks", selected_repo_data.forks)
+            st.metric("Watchers", selected_repo_data.watchers)
+            st.metric("Open Issues", selected_repo_data.open_issues)
+
+        with profiling.span("github:readme"):
+            show_readme(repos, selected_repo)
+
+
+def render():
+    st.title("GitHub Repositories")
+
+    github_usernames = ", ".join(GITHUB_ACCOUNTS)
+
+    with st.spinner(f"Fetching repositories for {github_usernames}..."):
+        try:
+            with profiling.span("github:fetch"):
+                # Last good snapshot; only the very first start waits for GitHub
+                refresher = get_repo_refresher(tuple(GITHUB_ACCOUNTS))
+                repos = refresher.snapshot(timeout=5)
+
+            if repos is None:
+                if refresher.last_error is not None:
+                    st.error(f"Error fetching GitHub repositories: {str(refresher.last_error)}")
+                else:
+                    st.info("Repositories are still loading, check back in a moment.")
+            elif repos:
+                st.success(f"Found {len(repos)} public repositories")
+
+                # An account that can't be refreshed keeps showing its last snapshot
+                for username, error in refresher.errors.items():
+                    st.warning(f"Could not refresh the repositories of {username}: {str(error)}")
+
+                show_details(refresher)
+
+                st.subheader("Repositories")
+
+                with profiling.span("github:table"):
+                    show_browser(refresher)
+
+            else:
+                st.warning(f"No public repositories found for {github_usernames}")
+
+        except Exception as e:
+            st.error(f"Error fetching GitHub repositories: {str(e)}")
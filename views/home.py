@@ -0,0 +1,25 @@
+import streamlit as st
+
+import content
+
+
+def render():
+    st.title("Data Science Portfolio")
+
+    # Modern two-column layout for intro
+    intro_col1, intro_col2 = st.columns([3, 2])
+
+    with intro_col1:
+        st.markdown(content.render("about"), unsafe_allow_html=True)
+
+    with intro_col2:
+        # Expertise card
+        st.markdown(content.render("expertise"), unsafe_allow_html=True)
+
+    # Professional Experience in list format
+    st.subheader("Professional Experience")
+    st.markdown(content.render("experience"), unsafe_allow_html=True)
+
+    # Education with modern styling
+    st.subheader("Education")
+    st.markdown(content.render("education"), unsafe_allow_html=True)
@@ -0,0 +1,8 @@
+import streamlit as st
+
+import content
+
+
+def render():
+    st.title("Data Science Projects")
+    st.markdown(content.render("projects"), unsafe_allow_html=True)